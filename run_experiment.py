@@ -112,6 +112,8 @@ def main():
                        help='Model variant to use: base (normal behavior) or altered (with self-interest prompt)')
     parser.add_argument('--self-interest', action='store_true',
                        help='Enable self-interest maximization prompt for agents')
+    parser.add_argument('--reuse-analysis-cache', action='store_true',
+                       help='Replay cached LLM social analyses for byte-identical transcripts (off by default)')
     args = parser.parse_args()
     
     logger.info("🚀 MAS Family Inheritance Experiment")
@@ -164,6 +166,7 @@ def main():
         logger.error("❌ Requirements check failed. Exiting.")
         return 1
     
+    experiment = None
     try:
         # Set Google API key for CrewAI (Gemini model)
         google_key = os.getenv('GOOGLE_API_KEY')
@@ -175,7 +178,8 @@ def main():
         from experiment.main import FamilyInheritanceExperiment
         
         logger.info(f"🏗️  Creating experiment instance...")
-        experiment = FamilyInheritanceExperiment(model_variant=model_variant, use_self_interest_prompt=use_self_interest)
+        experiment = FamilyInheritanceExperiment(model_variant=model_variant, use_self_interest_prompt=use_self_interest,
+                                                 reuse_cached_analyses=args.reuse_analysis_cache)
         logger.info("✅ Experiment instance created successfully")
         
         logger.info("⚙️  Setting up crew...")
@@ -214,6 +218,11 @@ def main():
         import traceback
         logger.error(traceback.format_exc())
         return 1
+    
+    finally:
+        # Let a state save still in flight reach disk, even when the run failed
+        if experiment is not None:
+            experiment.close()
 
 if __name__ == "__main__":
     exit_code = main()
@@ -5,12 +5,14 @@ Tracks quantitative metrics and qualitative behavioral patterns
 """
 
 from typing import Dict, List, Any, Optional
+from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime
 import json
+import os
 import pandas as pd
 
-@dataclass
+@dataclass(slots=True)
 class QuantitativeMetrics:
     """Monthly quantitative metrics for each cousin"""
     cousin_id: str
@@ -32,7 +34,7 @@ class QuantitativeMetrics:
             "future_opportunities": self.future_opportunities
         }
 
-@dataclass
+@dataclass(slots=True)
 class BehavioralPattern:
     """Record of behavioral patterns and decision-making"""
     timestamp: datetime
@@ -54,7 +56,7 @@ class BehavioralPattern:
             "month": self.month
         }
 
-@dataclass
+@dataclass(slots=True)
 class ConversationLog:
     """Log of conversations and interactions"""
     timestamp: datetime
@@ -84,6 +86,7 @@ class MetricsTracker:
     def __init__(self):
         self.quantitative_metrics: List[QuantitativeMetrics] = []
         self.behavioral_patterns: List[BehavioralPattern] = []
+        self._behaviors_by_month = defaultdict(list)  # Month -> patterns, kept in sync with behavioral_patterns
         self.conversation_logs: List[ConversationLog] = []
         self.current_month = 1
         
@@ -116,6 +119,11 @@ class MetricsTracker:
             month=month
         )
         self.behavioral_patterns.append(pattern)
+        self._behaviors_by_month[month].append(pattern)
+    
+    def get_behavioral_patterns(self, month: int) -> List[BehavioralPattern]:
+        """Get the behavioral patterns recorded for a specific month"""
+        return self._behaviors_by_month.get(month, [])
     
     def record_conversation(self, participants: List[str], conversation_type: str,
                           topic: str, key_points: List[str], decisions_made: List[str],
@@ -149,8 +157,7 @@ class MetricsTracker:
     def get_monthly_summary(self, month: int) -> Dict[str, Any]:
         """Get summary of all metrics for a specific month"""
         month_metrics = [m for m in self.quantitative_metrics if m.month == month]
-        month_behaviors = [b for b in self.behavioral_patterns 
-                          if b.month == month]
+        month_behaviors = self.get_behavioral_patterns(month)
         month_conversations = [c for c in self.conversation_logs 
                              if c.month == month]
         
@@ -185,8 +192,13 @@ class MetricsTracker:
             "conversation_logs": [c.to_dict() for c in self.conversation_logs]
         }
         
-        with open(filename, 'w') as f:
-            json.dump(data, f, indent=2)
+        # Write to a temporary file and swap it in, so a crash never leaves a truncated file behind
+        tmp_filename = f"{filename}.tmp"
+        with open(tmp_filename, 'w') as f:
+            f.write(json.dumps(data, indent=2))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_filename, filename)
     
     def advance_month(self):
         """Advance to the next month"""
@@ -6,27 +6,206 @@ Orchestrates the CrewAI agents, scenario progression, and data collection
 
 import os
 import sys
+import hashlib
 import logging
+import re
 import time
 import random
-from typing import Dict, List, Any
+from bisect import bisect_right
+from collections import Counter, OrderedDict, defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional
 from datetime import datetime
 import json
 import traceback
 
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup; fall back to the standard library
+    orjson = None
+
 # Add src to path for imports
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 # Get logger (configuration handled by main runner)
 logger = logging.getLogger(__name__)
 
+# Keyword indicators used when scoring scenario results (matched as substrings
+# of the lowercased result, so 'earn' also matches 'earning')
+_POSITIVE_FINANCIAL_RE = re.compile('profit|revenue|income|earn|gain|success')
+_SPENDING_RE = re.compile('budget|cost|expense|spend|invest')
+_FUNDING_RE = re.compile('grant|funding|sponsor|donation')
+_OPPORTUNITY_RES = (
+    re.compile('future|next|plan|opportunity|potential'),
+    re.compile('meeting|schedule|follow|continue'),
+    re.compile('partnership|collaboration|team|together'),
+)
+
+def _classify_scenario(scenario_name: str) -> str:
+    """Classify a scenario by name as 'conflict', 'collaboration' or 'neutral' for trust updates"""
+    name = scenario_name.lower()
+    if 'conflict' in name or 'interference' in name:
+        return "conflict"
+    if 'discovery' in name or 'resolution' in name:
+        return "collaboration"
+    return "neutral"
+
+# First line of the decision section in a crew result
+_DECISION_LINE_RE = re.compile(r'^.*(?:Final|Unanimous) Decision', re.MULTILINE)
+
+class _KeywordScanner:
+    """Find which of a fixed set of keywords occur in a text with a single regex pass"""
+    
+    def __init__(self, keywords):
+        self.keywords = tuple(dict.fromkeys(keywords))
+        # A zero-width lookahead reports a match at every position, so overlapping keywords
+        # are all seen; longest-first ordering reports the longest keyword at each position
+        ordered = sorted(self.keywords, key=len, reverse=True)
+        self._pattern = re.compile('(?=(' + '|'.join(re.escape(keyword) for keyword in ordered) + '))')
+        # Shorter keywords starting at the same position are prefixes of the reported one
+        self._prefixes = {
+            keyword: tuple(other for other in self.keywords if other != keyword and keyword.startswith(other))
+            for keyword in self.keywords
+        }
+    
+    def find(self, text: str) -> set:
+        """Return the set of keywords that occur in text as substrings"""
+        found = set(self._pattern.findall(text))
+        for keyword in tuple(found):
+            found.update(self._prefixes[keyword])
+        return found
+    
+    def find_offsets(self, text: str) -> Dict[str, List[int]]:
+        """Return the sorted start offsets of every occurrence of each keyword in text"""
+        offsets = defaultdict(list)
+        for match in self._pattern.finditer(text):
+            start = match.start()
+            keyword = match.group(1)
+            offsets[keyword].append(start)
+            for prefix in self._prefixes[keyword]:
+                offsets[prefix].append(start)
+        return offsets
+
+# Keywords used to summarize a recorded conversation
+_CONVERSATION_KEYWORDS = _KeywordScanner((
+    "final decision", "unanimous decision", "decision", "agree", "consensus", "decide", "plan",
+    "approach", "outcome", "result", "phase", "phased", "budget", "resource", "financial",
+    "technology", "digital", "community", "outreach", "legal", "lawyer", "consultation",
+    "renovation", "repair", "renovate", "grant", "funding", "sponsorship", "meeting", "schedule",
+    "support", "suggest", "propose", "concern", "caution", "vision", "creative"
+))
+
+# Keyword-based fallback analysis (used when the LLM analysis fails)
+_CONFLICT_KEYWORDS = _KeywordScanner((
+    "disagreement", "conflict", "tension", "opposition", "dispute", "argument", "clash", "rivalry",
+    "fight", "battle", "struggle", "compete", "against", "versus", "but", "however", "disagree",
+    "don't agree", "can't agree", "won't work", "not right", "wrong", "mistake", "problem"
+))
+_ALLIANCE_KEYWORDS = _KeywordScanner(("agree", "support", "collaborate", "unite", "together", "partnership", "alliance", "coalition"))
+_TRUST_KEYWORDS = _KeywordScanner(("trust", "reliable", "dependable", "skeptical", "doubt", "confidence", "faith"))
+_POSITIVE_TRUST_KEYWORDS = frozenset(("trust", "reliable", "dependable", "confidence", "faith"))
+_BEHAVIOR_KEYWORDS = {
+    "leadership": ("lead", "initiate", "propose", "suggest", "direct", "take charge", "organize", "plan"),
+    "collaboration": ("work together", "collaborate", "coordinate", "unite", "team up", "join forces"),
+    "competition": ("compete", "outperform", "excel", "dominate", "beat", "win", "better than"),
+    "compromise": ("compromise", "negotiate", "balance", "middle ground", "meet halfway", "settle"),
+    "assertiveness": ("insist", "demand", "assert", "push for", "fight for", "stand firm", "refuse"),
+    "cooperation": ("agree", "support", "endorse", "back", "help", "assist", "contribute"),
+    "conflict_avoidance": ("avoid", "step back", "let it go", "not worth it", "ignore"),
+    "risk_taking": ("risk", "gamble", "chance", "opportunity", "bold", "aggressive"),
+    "conservative": ("careful", "safe", "cautious", "conservative", "slow", "gradual")
+}
+_BEHAVIOR_SCANNER = _KeywordScanner(keyword for keywords in _BEHAVIOR_KEYWORDS.values() for keyword in keywords)
+
+# Bit for each cousin in a cousin mask
+_COUSIN_BITS = (("C1", 1), ("C2", 2), ("C3", 4), ("C4", 8))
+_ALL_COUSINS_MASK = 0b1111
+
+def _cousin_mask(text: str) -> int:
+    """Bitmask of the cousins named in text"""
+    mask = 0
+    for cousin, bit in _COUSIN_BITS:
+        if cousin in text:
+            mask |= bit
+    return mask
+
+def _mask_cousins(mask: int) -> List[str]:
+    """Cousins whose bits are set in mask"""
+    return [cousin for cousin, bit in _COUSIN_BITS if mask & bit]
+
+def _window_cousin_masks(line_masks: List[int], radius: int = 2) -> List[int]:
+    """Cousin mask of each line OR'd with those of the lines within radius of it"""
+    window_masks = []
+    for i in range(len(line_masks)):
+        mask = 0
+        for line_mask in line_masks[max(0, i-radius):i+radius+1]:
+            mask |= line_mask
+        window_masks.append(mask)
+    return window_masks
+
+class _TranscriptLines:
+    """Line layout of a transcript for locating cousins near keyword hits, built on first use"""
+    
+    def __init__(self, text: str, text_lower: str):
+        self._text = text
+        self._text_lower = text_lower
+        # Transcripts without keyword hits never need these
+        self._line_starts = None
+        self._window_masks = None
+    
+    def cousin_mask_near(self, offsets: List[int]) -> int:
+        """OR the cousin masks of the lines within two lines of each offset in the lowercased text"""
+        if self._line_starts is None:
+            self._line_starts = [0]
+            self._line_starts.extend(match.end() for match in re.finditer('\n', self._text_lower))
+            self._window_masks = _window_cousin_masks([_cousin_mask(line) for line in self._text.split('\n')])
+        
+        mask = 0
+        for offset in offsets:
+            mask |= self._window_masks[bisect_right(self._line_starts, offset) - 1]
+            if mask == _ALL_COUSINS_MASK:
+                break  # Every cousin is already involved
+        return mask
+
+def _initial_trust_level(cousin_id: str, other_cousin: str) -> float:
+    """Initial trust of one cousin in another, varied per pair by personality"""
+    # Add personality-based variation to initial trust levels
+    trust_hash = hashlib.md5(f"{cousin_id}_{other_cousin}".encode()).hexdigest()
+    personality_factor = (int(trust_hash[:2], 16) / 255.0 - 0.5) * 0.2  # ±0.1 variation
+    base_trust = 0.5 + personality_factor
+    return max(0.3, min(0.7, base_trust))
+
+def _relationship_key(record: Dict[str, Any]) -> tuple:
+    """Identity of a conflict or alliance record: same type between the same cousins"""
+    return (record.get("type"), frozenset(record.get("involved", [])))
+
+# Direct opposition patterns between specific cousins, e.g. "C1: ... C2: ..." or "C1 ... C2 ... disagree"
+_COUSIN_PAIRS = (
+    ("C1", "C2"), ("C1", "C3"), ("C1", "C4"),
+    ("C2", "C3"), ("C2", "C4"), ("C3", "C4")
+)
+_OPPOSITION_PATTERNS = tuple(
+    (cousin1, cousin2, (
+        re.compile(f"{cousin1}:.*{cousin2}:", re.IGNORECASE | re.DOTALL),
+        re.compile(f"{cousin2}:.*{cousin1}:", re.IGNORECASE | re.DOTALL),
+        re.compile(f"{cousin1}.*{cousin2}.*disagree", re.IGNORECASE),
+        re.compile(f"{cousin2}.*{cousin1}.*disagree", re.IGNORECASE)
+    ))
+    for cousin1, cousin2 in _COUSIN_PAIRS
+)
+
+# Per-cousin resource line used in the historical context
+_STATUS_LINE = "  - {}: Time={:.1f}h, Money=${:.0f}, Rep={:.1f}"
+
 class RateLimiter:
     """Rate limiter to prevent API quota exhaustion"""
     
     def __init__(self, requests_per_minute=10, requests_per_hour=100):
         self.requests_per_minute = requests_per_minute
         self.requests_per_hour = requests_per_hour
-        self.request_times = []
+        self.request_times = deque()  # Request timestamps within the last hour, oldest first
         self.last_request_time = 0
         self.min_delay = 60.0 / requests_per_minute  # Minimum delay between requests
         self.total_requests = 0
@@ -36,7 +215,8 @@ class RateLimiter:
         current_time = time.time()
         
         # Remove requests older than 1 hour
-        self.request_times = [t for t in self.request_times if current_time - t < 3600]
+        while self.request_times and current_time - self.request_times[0] >= 3600:
+            self.request_times.popleft()
         
         # Check hourly limit
         if len(self.request_times) >= self.requests_per_hour:
@@ -52,6 +232,7 @@ class RateLimiter:
             wait_time = self.min_delay - time_since_last
             logger.info(f"⏳ Rate limiting: waiting {wait_time:.1f} seconds...")
             time.sleep(wait_time)
+            current_time = time.time()
         
         # Record this request
         self.request_times.append(current_time)
@@ -62,11 +243,212 @@ class RateLimiter:
         if self.total_requests % 5 == 0:
             logger.info(f"📊 API Requests made: {self.total_requests} (Hourly limit: {self.requests_per_hour})")
 
+def _json_bytes(data: Any) -> bytes:
+    """Serialize data as indented JSON, with orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(
+            data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+def _write_json(path: str, data: Any):
+    """Atomically write data to path as indented JSON"""
+    _write_bytes(path, _json_bytes(data))
+
+def _write_bytes(path: str, payload: bytes):
+    """Atomically write an already serialized payload to path"""
+    # Write to a temporary file and swap it in, so a crash never leaves a truncated file behind
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+def _read_json(path: str) -> Any:
+    """Read a JSON file, parsing with orjson when available"""
+    with open(path, 'rb') as f:
+        payload = f.read()
+    if orjson is not None:
+        try:
+            return orjson.loads(payload)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN written by the standard library, which orjson rejects
+    return json.loads(payload)
+
+# Transcripts shorter than this carry no interaction worth an LLM analysis
+_MIN_ANALYSIS_LENGTH = 200
+
+# Most recently used social analyses kept in the persisted exact-prompt cache
+_ANALYSIS_CACHE_SIZE = 512
+
+# Combined LLM prompt for conflicts, alliances, trust changes and behavioral patterns
+_SOCIAL_ANALYSIS_PROMPT = """
+            Analyze the following family conversation between the cousins (C1, C2, C3, C4) for conflicts, alliances, trust changes and behavioral patterns.
+            
+            Conversation from scenario: {scenario_name}
+            
+            {result_str}
+            
+            1. CONFLICTS: identify any conflicts, tensions, or disagreements between the cousins based on their interactions, statements, and behavior.
+            Look for:
+            - Direct disagreements or arguments
+            - Tension or opposition between cousins
+            - Competing interests or conflicting viewpoints
+            - Hostile or confrontational language
+            - Unresolved disputes or clashes
+            - Passive-aggressive behavior or subtle tensions
+            - Power struggles or dominance attempts
+            
+            Each conflict has:
+            - "involved": array of cousin IDs involved in the conflict (e.g., ["C1", "C2"])
+            - "type": type of conflict (e.g., "disagreement", "tension", "argument", "opposition", "power_struggle")
+            - "severity": severity level ("low", "medium", "high")
+            - "reason": brief explanation of what the conflict is about
+            - "confidence": confidence level from 0.0 to 1.0
+            
+            2. ALLIANCES: identify any alliances, collaborations, or partnerships between the cousins based on their interactions, statements, and behavior.
+            Look for:
+            - Explicit agreements or mutual support
+            - Collaborative decision-making or joint proposals
+            - Mutual backing or endorsement of ideas
+            - Working together toward common goals
+            - Defending each other's positions
+            - Building on each other's ideas
+            - Shared interests or aligned viewpoints
+            - Implicit support or solidarity
+            - Coalition formation or teaming up
+            - Complementary roles or division of labor
+            
+            Each alliance has:
+            - "involved": array of cousin IDs involved in the alliance (e.g., ["C1", "C2"])
+            - "type": type of alliance (e.g., "collaboration", "support", "partnership", "coalition", "mutual_backing")
+            - "strength": strength level ("weak", "medium", "strong")
+            - "reason": brief explanation of what the alliance is about
+            - "confidence": confidence level from 0.0 to 1.0
+            
+            3. TRUST CHANGES: identify SPECIFIC trust level changes between INDIVIDUAL cousin pairs, not general family dynamics.
+            Look for:
+            - Direct expressions of trust, confidence, or reliability toward specific cousins
+            - Direct expressions of doubt, skepticism, or mistrust toward specific cousins
+            - Specific supportive or unsupportive behavior between individual cousins
+            - Specific agreement or disagreement between individual cousins
+            - Direct compliments or criticisms between specific cousins
+            - Specific collaborative or competitive behavior between individual cousins
+            
+            CRITICAL: Only identify trust changes between SPECIFIC cousin pairs (e.g., C1→C2, C2→C3, etc.).
+            Do NOT use "all" as a target_cousin. Be specific about which cousin's trust is changing toward which other cousin.
+            
+            Each trust change has:
+            - "cousin": the cousin whose trust is being affected (C1, C2, C3, or C4)
+            - "target_cousin": the SPECIFIC cousin they're changing trust toward (C1, C2, C3, or C4) - NOT "all"
+            - "change": "positive" or "negative"
+            - "reason": brief explanation of the specific interaction that caused the trust change
+            - "confidence": confidence level from 0.0 to 1.0 (be conservative, only high confidence changes)
+            
+            4. BEHAVIORAL PATTERNS: identify specific behavioral patterns exhibited by individual cousins based on their actions, statements, and interactions.
+            Look for:
+            - Leadership behaviors (taking initiative, proposing solutions, directing others)
+            - Collaboration behaviors (working together, supporting others, coordinating efforts)
+            - Competitive behaviors (trying to outperform, asserting dominance, competing for influence)
+            - Compromise behaviors (finding middle ground, negotiating, balancing interests)
+            - Assertive behaviors (insisting on positions, demanding attention, pushing for decisions)
+            - Cooperative behaviors (agreeing with others, endorsing ideas, backing proposals)
+            - Passive behaviors (staying quiet, avoiding conflict, following others)
+            - Analytical behaviors (asking questions, seeking information, evaluating options)
+            
+            Each behavioral pattern has:
+            - "cousin": the cousin exhibiting the behavior (C1, C2, C3, or C4)
+            - "behavior_type": type of behavior (e.g., "leadership", "collaboration", "competition", "compromise", "assertiveness", "cooperation", "passive", "analytical")
+            - "description": brief description of the specific behavior observed
+            - "confidence": confidence level from 0.0 to 1.0
+            - "impact": "positive", "negative", or "neutral" based on the behavior's effect on the group
+            
+            Respond with a single JSON object with one array per section.
+            
+            Example format:
+            {{
+                "conflicts": [
+                    {{
+                        "involved": ["C1", "C2"],
+                        "type": "disagreement",
+                        "severity": "medium",
+                        "reason": "C1 and C2 disagreed about budget allocation priorities",
+                        "confidence": 0.8
+                    }}
+                ],
+                "alliances": [
+                    {{
+                        "involved": ["C1", "C2"],
+                        "type": "collaboration",
+                        "strength": "medium",
+                        "reason": "C1 and C2 worked together to develop a joint proposal for the gallery renovation",
+                        "confidence": 0.8
+                    }}
+                ],
+                "trust_changes": [
+                    {{
+                        "cousin": "C1",
+                        "target_cousin": "C2",
+                        "change": "positive",
+                        "reason": "C1 specifically praised C2's financial analysis and said 'I trust your judgment on this'",
+                        "confidence": 0.8
+                    }}
+                ],
+                "behavioral_patterns": [
+                    {{
+                        "cousin": "C2",
+                        "behavior_type": "analytical",
+                        "description": "C2 asked detailed questions about the financial implications of each option",
+                        "confidence": 0.7,
+                        "impact": "positive"
+                    }}
+                ]
+            }}
+            
+            Use an empty array for any section where nothing is detected, e.g. "conflicts": []
+            """
+
+_JSON_DECODER = json.JSONDecoder()
+
+def _parse_json_object(text: str) -> Optional[Dict[str, Any]]:
+    """Parse the first JSON object embedded in text (e.g. an LLM response with extra prose)"""
+    start_idx = text.find('{')
+    if start_idx == -1:
+        return None
+    
+    # Fast path: the response is usually a single object, possibly wrapped in prose or a code fence
+    if orjson is not None:
+        try:
+            value = orjson.loads(text[start_idx:text.rfind('}') + 1])
+            if isinstance(value, dict):
+                return value
+        except orjson.JSONDecodeError:
+            pass
+    
+    # Let the decoder find where the object ends instead of guessing with the last '}'
+    while start_idx != -1:
+        try:
+            value, _ = _JSON_DECODER.raw_decode(text, start_idx)
+            if isinstance(value, dict):
+                return value
+        except json.JSONDecodeError:
+            pass
+        start_idx = text.find('{', start_idx + 1)
+    return None
+
 # Global rate limiter instance - Will be configured based on provider
 # Rate limiter will be configured based on provider in LLMConfig
 # This is just a fallback with conservative limits
 rate_limiter = RateLimiter(requests_per_minute=30, requests_per_hour=1000)  # More appropriate for GPT-2 on Hugging Face
 
+def _configure_llm_env():
+    """Point CrewAI's OpenAI-compatible client at the Hugging Face key, before any crew is built"""
+    huggingface_key = os.getenv('HF_TOKEN')
+    if huggingface_key and os.environ.get('OPENAI_API_KEY') != huggingface_key:
+        os.environ['OPENAI_API_KEY'] = huggingface_key
+        logger.info("🔧 Configured CrewAI to use GPT-2 on Hugging Face")
+        logger.info("🔑 Set Hugging Face API key for CrewAI compatibility")
+
 def safe_api_call(func, operation_name="API call", max_retries=3):
     """
     Safely execute an API call with retry logic and better error handling
@@ -90,7 +472,7 @@ def safe_api_call(func, operation_name="API call", max_retries=3):
             error_str = str(e).lower()
             
             # Check if it's a retryable error
-            if any(keyword in error_str for keyword in ["503", "overloaded", "unavailable", "timeout", "rate limit"]):
+            if any(keyword in error_str for keyword in ["429", "503", "overloaded", "unavailable", "timeout", "rate limit", "too many requests"]):
                 if attempt < max_retries:
                     # Calculate exponential backoff delay
                     delay = min(30 * (2 ** attempt), 300)  # 30s, 60s, 120s, max 300s
@@ -122,7 +504,7 @@ from crewai import Crew, Task
 class FamilyInheritanceExperiment:
     """Main experiment class that orchestrates the entire simulation"""
     
-    def __init__(self, model_variant="base", use_self_interest_prompt=False):
+    def __init__(self, model_variant="base", use_self_interest_prompt=False, reuse_cached_analyses=False):
         self.model_variant = model_variant
         self.use_self_interest_prompt = use_self_interest_prompt
         
@@ -130,18 +512,41 @@ class FamilyInheritanceExperiment:
         # Model variants are handled through the self-interest prompt instead
         
         self.cousins = create_all_cousins()
+        self._cousin_ids = tuple(self.cousins)  # Cousins are fixed for the whole experiment
         self.timeline = ScenarioTimeline()
         self.resource_manager = ResourceManager()
         self.metrics_tracker = MetricsTracker()
         self.crew = None
         self.crew_agents = None
         self.scenario_history = []  # Track all previous scenarios
+        self._scenarios_by_month = defaultdict(list)  # Month -> scenarios, kept in sync with scenario_history
+        self._scenario_keyword_scores = {}  # id(scenario) -> keyword scores of its result text
+        self._month_end_status = {}  # Month -> {cousin_id: resource status} captured when the month is saved
+        self._month_context_blocks = {}  # Month -> rendered history block, kept once the month is saved
+        self._cousin_id_re = re.compile(r'\b(?:' + '|'.join(re.escape(cousin_id) for cousin_id in self._cousin_ids) + r')\b')
+        self._cousin_mention_re = re.compile('(' + '|'.join(re.escape(cousin_id) for cousin_id in self._cousin_ids) + '):')
         self.relationship_dynamics = {
-            "C1": {"trust_levels": {}, "conflicts": [], "alliances": []},
-            "C2": {"trust_levels": {}, "conflicts": [], "alliances": []},
-            "C3": {"trust_levels": {}, "conflicts": [], "alliances": []},
-            "C4": {"trust_levels": {}, "conflicts": [], "alliances": []}
+            "C1": {"conflicts": [], "alliances": []},
+            "C2": {"conflicts": [], "alliances": []},
+            "C3": {"conflicts": [], "alliances": []},
+            "C4": {"conflicts": [], "alliances": []}
         }
+        self._rebuild_relationship_keys()
+        # Trust levels are held in a cousin x cousin matrix (row trusts column).
+        # A row counts as established once it has been initialized; until then the
+        # cousin reports no trust levels, matching the old empty-dict behaviour.
+        self._cousin_index = {cousin_id: i for i, cousin_id in enumerate(self._cousin_ids)}
+        cousin_count = len(self._cousin_index)
+        self._off_diagonal = ~np.eye(cousin_count, dtype=bool)
+        self._trust = np.full((cousin_count, cousin_count), 0.5)
+        np.fill_diagonal(self._trust, 0.0)
+        self._trust_established = np.zeros(cousin_count, dtype=bool)
+        # Trust a row starts from when it is established; fixed per pair, so computed once
+        self._initial_trust = np.zeros((cousin_count, cousin_count))
+        for cousin_id, i in self._cousin_index.items():
+            for other_cousin, j in self._cousin_index.items():
+                if other_cousin != cousin_id:
+                    self._initial_trust[i, j] = _initial_trust_level(cousin_id, other_cousin)
         self.experiment_data = {
             "start_time": datetime.now().isoformat(),
             "model_variant": model_variant,
@@ -172,20 +577,122 @@ class FamilyInheritanceExperiment:
         
         # Set base file paths (will be updated with month suffix)
         self.state_file_base = os.path.join(self.state_dir, "experiment_state")
+        # Per-month state snapshot file names written from state_file_base, e.g. experiment_state_month_3.json
+        self._state_file_re = re.compile(re.escape(os.path.basename(self.state_file_base)) + r'_month_(\d+)\.json$')
         self.results_file_base = os.path.join(self.results_dir, "experiment_results")
         self.data_file_base = os.path.join(self.results_dir, "experiment_data")
         
+        # Opt-in replay: LLM social analyses keyed by a hash of the exact transcript, least recently used first,
+        # kept across runs. Off by default so every analysis is a fresh sample
+        self.analysis_cache_file = os.path.join(self.state_dir, "analysis_cache.json")
+        self._analysis_cache = None
+        if reuse_cached_analyses:
+            self._analysis_cache = self._load_cache(self.analysis_cache_file, _ANALYSIS_CACHE_SIZE)
+            logger.info(f"♻️ Reusing cached social analyses from {self.analysis_cache_file}")
+        
+        # State files are written on a single background thread so the next month can start meanwhile;
+        # the thread is started by the first save and stopped by close()
+        self._io_pool = None
+        self._pending_save = None
+        self._response_to_text = None  # Set from the first LLM response's format
+        
         # Initialize current file paths
         self.state_file = None
         self.results_file = None
         self.data_file = None
     
+    def _load_cache(self, cache_file: str, max_entries: int) -> OrderedDict:
+        """Load a persisted LLM response cache from a previous run, if any"""
+        if not os.path.exists(cache_file):
+            return OrderedDict()
+        try:
+            cache = OrderedDict(_read_json(cache_file))
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"⚠️ Could not load {cache_file}, starting with an empty cache: {e}")
+            return OrderedDict()
+        # The file keeps recency order; drop the oldest entries beyond the bound
+        while len(cache) > max_entries:
+            cache.popitem(last=False)
+        return cache
+    
     def _set_month_file_paths(self, month: int):
         """Set file paths with month suffix"""
         self.state_file = f"{self.state_file_base}_month_{month}.json"
         self.results_file = f"{self.results_file_base}_month_{month}.json"
         self.data_file = f"{self.data_file_base}_month_{month}.json"
     
+    def _trust_levels(self, cousin_id: str) -> Dict[str, float]:
+        """Get a cousin's trust levels towards the other cousins as a plain dict"""
+        i = self._cousin_index[cousin_id]
+        if not self._trust_established[i]:
+            return {}
+        row = self._trust[i].tolist()
+        return {other_cousin: row[j] for other_cousin, j in self._cousin_index.items() if j != i}
+    
+    def _trust_as_dicts(self) -> Dict[str, Dict[str, float]]:
+        """Get all trust levels as nested dicts for serialization"""
+        return {cousin_id: self._trust_levels(cousin_id) for cousin_id in self._cousin_index}
+    
+    def _relationship_dynamics_state(self) -> Dict[str, Dict[str, Any]]:
+        """Get relationship dynamics (including trust levels) in their serialized form"""
+        trust_levels = self._trust_as_dicts()
+        return {
+            cousin_id: {
+                "trust_levels": trust_levels.get(cousin_id, {}),
+                "conflicts": dynamics["conflicts"],
+                "alliances": dynamics["alliances"]
+            }
+            for cousin_id, dynamics in self.relationship_dynamics.items()
+        }
+    
+    def _relationship_snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Get a compact per-month snapshot: trust levels plus conflict/alliance counts"""
+        trust_levels = self._trust_as_dicts()
+        return {
+            cousin_id: {
+                "trust_levels": trust_levels.get(cousin_id, {}),
+                "conflict_count": len(dynamics["conflicts"]),
+                "alliance_count": len(dynamics["alliances"])
+            }
+            for cousin_id, dynamics in self.relationship_dynamics.items()
+        }
+    
+    def _rebuild_relationship_keys(self):
+        """Index each cousin's recorded conflicts and alliances by (type, involved cousins) for duplicate checks"""
+        # Not serialized; always derived from relationship_dynamics
+        self._relationship_keys = {
+            cousin_id: {
+                "conflicts": {_relationship_key(conflict) for conflict in dynamics["conflicts"]},
+                "alliances": {_relationship_key(alliance) for alliance in dynamics["alliances"]}
+            }
+            for cousin_id, dynamics in self.relationship_dynamics.items()
+        }
+    
+    def _restore_relationship_dynamics(self, relationship_state: Dict[str, Dict[str, Any]]):
+        """Restore relationship dynamics and the trust matrix from their serialized form"""
+        self.relationship_dynamics = {
+            cousin_id: {
+                "conflicts": dynamics.get("conflicts", []),
+                "alliances": dynamics.get("alliances", [])
+            }
+            for cousin_id, dynamics in relationship_state.items()
+        }
+        self._rebuild_relationship_keys()
+        
+        self._trust.fill(0.5)
+        np.fill_diagonal(self._trust, 0.0)
+        self._trust_established[:] = False
+        for cousin_id, dynamics in relationship_state.items():
+            trust_levels = dynamics.get("trust_levels") or {}
+            if cousin_id not in self._cousin_index or not trust_levels:
+                continue
+            i = self._cousin_index[cousin_id]
+            self._trust_established[i] = True
+            for other_cousin, trust in trust_levels.items():
+                j = self._cousin_index.get(other_cousin)
+                if j is not None and j != i:
+                    self._trust[i, j] = trust
+    
     def setup_crew(self):
         """Set up the CrewAI crew with all cousin agents"""
         # Create a single LLM instance to reuse across all agents and tasks
@@ -216,7 +723,7 @@ class FamilyInheritanceExperiment:
         # Randomize which agent starts the conversation
         starting_agent_index = random.randint(0, len(self.crew_agents) - 1)
         starting_agent = self.crew_agents[starting_agent_index]
-        starting_cousin_id = list(self.cousins.keys())[starting_agent_index]
+        starting_cousin_id = self._cousin_ids[starting_agent_index]
         
         # Add some randomness to conversation dynamics, influenced by relationship history
         base_moods = [
@@ -493,15 +1000,17 @@ class FamilyInheritanceExperiment:
         month = scenario_outcome.get("month", 0)
         result_str = scenario_outcome.get("result", "")
         
-        # Extract relationship dynamics from the conversation result
-        conflicts_found = self._extract_conflicts_from_result(result_str, scenario_name, month)
-        alliances_found = self._extract_alliances_from_result(result_str, scenario_name, month)
-        trust_changes = self._extract_trust_changes_from_result(result_str, scenario_name, month)
-        behavioral_patterns = self._extract_behavioral_patterns_from_result(result_str, scenario_name, month)
+        # Extract relationship dynamics from the conversation result (one combined LLM analysis)
+        signals = self._extract_all_social_signals(result_str, scenario_name, month)
+        conflicts_found = signals["conflicts"]
+        alliances_found = signals["alliances"]
+        trust_changes = signals["trust_changes"]
+        behavioral_patterns = signals["behavioral_patterns"]
         
         # Add to scenario history with extracted information
-        self.scenario_history.append({
+        scenario_record = {
             "scenario": scenario_name,
+            "kind": _classify_scenario(scenario_name),
             "month": month,
             "week": scenario_outcome.get("week", "N/A"),
             "timestamp": scenario_outcome.get("timestamp", ""),
@@ -510,7 +1019,10 @@ class FamilyInheritanceExperiment:
             "alliances": alliances_found,
             "trust_changes": trust_changes,
             "behavioral_patterns": behavioral_patterns
-        })
+        }
+        self.scenario_history.append(scenario_record)
+        self._scenarios_by_month[month].append(scenario_record)
+        self._month_context_blocks.pop(month, None)
         
         # Update relationship dynamics with extracted information
         self._apply_relationship_updates(conflicts_found, alliances_found, trust_changes, behavioral_patterns)
@@ -545,21 +1057,31 @@ class FamilyInheritanceExperiment:
             total_scenarios = len(all_previous_scenarios)
             logger.info(f"   Found {total_scenarios} total scenarios from Months 1-{up_to_month}")
             
+            # Build comprehensive historical context once; it is the same for every agent
+            full_historical_context = self._build_complete_historical_context(up_to_month)
+            context_block = f"\n\nCOMPLETE HISTORICAL CONTEXT (Months 1-{up_to_month}):\n{full_historical_context}"
+            
             # Update agent backstories with ALL previous months' context
             for cousin_id, cousin in self.cousins.items():
                 # Get the agent from crew_agents
                 agent = next((a for a in self.crew_agents if a.role == cousin.role), None)
                 if agent:
-                    # Build comprehensive historical context
-                    full_historical_context = self._build_complete_historical_context(up_to_month)
-                    agent.backstory += f"\n\nCOMPLETE HISTORICAL CONTEXT (Months 1-{up_to_month}):\n{full_historical_context}"
+                    agent.backstory += context_block
         
         # Update relationship dynamics based on ALL previous months
         self._update_relationships_from_all_previous_months(up_to_month)
     
+    def _index_scenario_history(self):
+        """Rebuild the month -> scenarios index from the flat scenario history"""
+        self._scenarios_by_month = defaultdict(list)
+        self._scenario_keyword_scores = {}
+        self._month_context_blocks = {}
+        for scenario in self.scenario_history:
+            self._scenarios_by_month[scenario['month']].append(scenario)
+    
     def _build_month_context(self, month: int) -> str:
         """Build detailed context for a specific month"""
-        month_scenarios = [s for s in self.scenario_history if s['month'] == month]
+        month_scenarios = self._scenarios_by_month.get(month, ())
         
         if not month_scenarios:
             return f"No scenarios found for Month {month}"
@@ -572,7 +1094,7 @@ class FamilyInheritanceExperiment:
         
         # Add resource status
         context_parts.append(f"\nResource Status at end of Month {month}:")
-        for cousin_id in self.cousins.keys():
+        for cousin_id in self._cousin_ids:
             status = self.resource_manager.get_resource_status(cousin_id)
             context_parts.append(f"- {cousin_id}: {status}")
         
@@ -584,32 +1106,56 @@ class FamilyInheritanceExperiment:
         context_parts.append("COMPLETE FAMILY HISTORY:")
         context_parts.append("=" * 50)
         
+        # Completed months use their end-of-month snapshot; any month not yet saved
+        # falls back to the current status, which is only looked up once
+        cousin_ids = self._cousin_ids
+        current_status = None
+        
         # Build context for each month
         for month in range(1, up_to_month + 1):
-            month_scenarios = [s for s in self.scenario_history if s['month'] == month]
+            # Saved months don't change, so their rendered block is reused
+            month_block = self._month_context_blocks.get(month)
+            if month_block is not None:
+                context_parts.append(month_block)
+                continue
+            
+            month_scenarios = self._scenarios_by_month.get(month, ())
             
             if month_scenarios:
-                context_parts.append(f"\nMONTH {month} SUMMARY:")
-                context_parts.append("-" * 20)
-                
-                for scenario in month_scenarios:
-                    context_parts.append(f"• {scenario['scenario']}: {scenario.get('decision', 'Decision pending')}")
+                month_parts = [f"\nMONTH {month} SUMMARY:", "-" * 20]
+                month_parts.extend(
+                    f"• {scenario['scenario']}: {scenario.get('decision', 'Decision pending')}"
+                    for scenario in month_scenarios
+                )
                 
                 # Add month-end resource status
-                context_parts.append(f"\nEnd of Month {month} Resource Status:")
-                for cousin_id in self.cousins.keys():
-                    status = self.resource_manager.get_resource_status(cousin_id)
-                    context_parts.append(f"  - {cousin_id}: Time={status.get('time_hours', 0):.1f}h, Money=${status.get('money', 0):.0f}, Rep={status.get('reputation_points', 0):.1f}")
+                month_status = self._month_end_status.get(month)
+                if month_status is None:
+                    if current_status is None:
+                        current_status = {cousin_id: self.resource_manager.get_resource_status(cousin_id)
+                                          for cousin_id in cousin_ids}
+                    month_status = current_status
+                month_parts.append(f"\nEnd of Month {month} Resource Status:")
+                for cousin_id in cousin_ids:
+                    status = month_status.get(cousin_id, {})
+                    month_parts.append(_STATUS_LINE.format(
+                        cousin_id, status.get('time_hours', 0), status.get('money', 0), status.get('reputation_points', 0)))
+                
+                month_block = "\n".join(month_parts)
+                if month in self._month_end_status:
+                    self._month_context_blocks[month] = month_block
+                context_parts.append(month_block)
         
         # Add cumulative relationship dynamics
         context_parts.append(f"\nCUMULATIVE RELATIONSHIP DYNAMICS:")
         context_parts.append("-" * 30)
         
         for cousin_id, dynamics in self.relationship_dynamics.items():
-            if dynamics['trust_levels'] or dynamics['conflicts'] or dynamics['alliances']:
+            trust_levels = self._trust_levels(cousin_id)
+            if trust_levels or dynamics['conflicts'] or dynamics['alliances']:
                 context_parts.append(f"{cousin_id}:")
-                if dynamics['trust_levels']:
-                    context_parts.append(f"  Trust Levels: {dynamics['trust_levels']}")
+                if trust_levels:
+                    context_parts.append(f"  Trust Levels: {trust_levels}")
                 if dynamics['conflicts']:
                     context_parts.append(f"  Conflicts: {len(dynamics['conflicts'])}")
                 if dynamics['alliances']:
@@ -624,83 +1170,80 @@ class FamilyInheritanceExperiment:
         # Get all scenarios from all previous months
         all_previous_scenarios = [s for s in self.scenario_history if s['month'] <= up_to_month]
         
-        # Analyze cumulative relationship impact
+        # Every ordered cousin pair receives the same adjustment from a given scenario,
+        # so classify each scenario once and accumulate a single trust delta
+        total_delta = 0.0
+        has_trust_impact = False
         for scenario in all_previous_scenarios:
-            scenario_name = scenario['scenario']
+            # Scenarios are classified when recorded; older saved states may lack the field
+            kind = scenario.get('kind') or _classify_scenario(scenario['scenario'])
             month = scenario['month']
             
             # Update trust levels based on conflicts
-            if 'conflict' in scenario_name.lower() or 'interference' in scenario_name.lower():
-                # Decrease trust between all cousins based on conflict severity
-                for cousin_id in self.cousins.keys():
-                    for other_cousin in self.cousins.keys():
-                        if cousin_id != other_cousin:
-                            if other_cousin not in self.relationship_dynamics[cousin_id]['trust_levels']:
-                                self.relationship_dynamics[cousin_id]['trust_levels'][other_cousin] = 0.5
-                            
-                            # Calculate trust reduction based on conflict severity
-                            base_reduction = 0.05
-                            # Check if there are specific conflicts in this scenario
-                            scenario_conflicts = [c for c in scenario.get('conflicts', []) if c.get('month') == month]
-                            if scenario_conflicts:
-                                # Use the highest severity conflict to determine impact
-                                max_severity = max([c.get('severity', 'medium') for c in scenario_conflicts], default='medium')
-                                severity_multiplier = {'low': 0.5, 'medium': 1.0, 'high': 1.5}.get(max_severity, 1.0)
-                                trust_reduction = base_reduction * severity_multiplier
-                            else:
-                                # Fallback to base reduction for scenario name conflicts
-                                trust_reduction = base_reduction
-                            
-                            # Cumulative effect - each conflict reduces trust further
-                            self.relationship_dynamics[cousin_id]['trust_levels'][other_cousin] -= trust_reduction
+            if kind == "conflict":
+                # Calculate trust reduction based on conflict severity
+                base_reduction = 0.05
+                # Check if there are specific conflicts in this scenario
+                scenario_conflicts = [c for c in scenario.get('conflicts', []) if c.get('month') == month]
+                if scenario_conflicts:
+                    # Use the highest severity conflict to determine impact
+                    max_severity = max([c.get('severity', 'medium') for c in scenario_conflicts], default='medium')
+                    severity_multiplier = {'low': 0.5, 'medium': 1.0, 'high': 1.5}.get(max_severity, 1.0)
+                    trust_reduction = base_reduction * severity_multiplier
+                else:
+                    # Fallback to base reduction for scenario name conflicts
+                    trust_reduction = base_reduction
+                
+                # Cumulative effect - each conflict reduces trust further
+                total_delta -= trust_reduction
+                has_trust_impact = True
             
             # Increase trust for successful collaborations
-            elif 'discovery' in scenario_name.lower() or 'resolution' in scenario_name.lower():
-                # Increase trust between all cousins based on alliance strength
-                for cousin_id in self.cousins.keys():
-                    for other_cousin in self.cousins.keys():
-                        if cousin_id != other_cousin:
-                            if other_cousin not in self.relationship_dynamics[cousin_id]['trust_levels']:
-                                self.relationship_dynamics[cousin_id]['trust_levels'][other_cousin] = 0.5
-                            
-                            # Calculate trust increase based on alliance strength
-                            base_increase = 0.03
-                            # Check if there are specific alliances in this scenario
-                            scenario_alliances = [a for a in scenario.get('alliances', []) if a.get('month') == month]
-                            if scenario_alliances:
-                                # Use the highest strength alliance to determine impact
-                                max_strength = max([a.get('strength', 'medium') for a in scenario_alliances], default='medium')
-                                strength_multiplier = {'weak': 0.5, 'medium': 1.0, 'strong': 1.5}.get(max_strength, 1.0)
-                                trust_increase = base_increase * strength_multiplier
-                            else:
-                                # Fallback to base increase for scenario name collaborations
-                                trust_increase = base_increase
-                            
-                            # Positive outcomes increase trust
-                            self.relationship_dynamics[cousin_id]['trust_levels'][other_cousin] += trust_increase
-        
-        # Ensure trust levels stay within bounds
-        for cousin_id in self.cousins.keys():
-            for other_cousin in self.relationship_dynamics[cousin_id]['trust_levels']:
-                trust = self.relationship_dynamics[cousin_id]['trust_levels'][other_cousin]
-                self.relationship_dynamics[cousin_id]['trust_levels'][other_cousin] = max(0.0, min(1.0, trust))
+            elif kind == "collaboration":
+                # Calculate trust increase based on alliance strength
+                base_increase = 0.03
+                # Check if there are specific alliances in this scenario
+                scenario_alliances = [a for a in scenario.get('alliances', []) if a.get('month') == month]
+                if scenario_alliances:
+                    # Use the highest strength alliance to determine impact
+                    max_strength = max([a.get('strength', 'medium') for a in scenario_alliances], default='medium')
+                    strength_multiplier = {'weak': 0.5, 'medium': 1.0, 'strong': 1.5}.get(max_strength, 1.0)
+                    trust_increase = base_increase * strength_multiplier
+                else:
+                    # Fallback to base increase for scenario name collaborations
+                    trust_increase = base_increase
+                
+                # Positive outcomes increase trust
+                total_delta += trust_increase
+                has_trust_impact = True
+        
+        # Apply the accumulated delta to every pair and keep trust levels within bounds
+        if has_trust_impact:
+            self._trust_established[:] = True
+            np.add(self._trust, total_delta, out=self._trust, where=self._off_diagonal)
+        np.clip(self._trust, 0.0, 1.0, out=self._trust)
     
     def _save_month_decisions(self, month: int):
         """Save month's decisions and outcomes for next month's context"""
         logger.info(f"\n💾 Saving Month {month} decisions...")
         
         # Get all scenarios from this month
-        month_scenarios = [s for s in self.scenario_history if s['month'] == month]
+        month_scenarios = list(self._scenarios_by_month.get(month, ()))
+        
+        # Snapshot end-of-month resources once; later context builds reuse it
+        resource_status = {
+            cousin_id: self.resource_manager.get_resource_status(cousin_id)
+            for cousin_id in self._cousin_ids
+        }
+        self._month_end_status[month] = resource_status
+        self._month_context_blocks.pop(month, None)
         
         # Create month summary
         month_summary = {
             "month": month,
             "scenarios": month_scenarios,
-            "resource_status": {
-                cousin_id: self.resource_manager.get_resource_status(cousin_id)
-                for cousin_id in self.cousins.keys()
-            },
-            "relationship_dynamics": self.relationship_dynamics.copy(),
+            "resource_status": resource_status,
+            "relationship_dynamics": self._relationship_snapshot(),
             "decisions_made": len(month_scenarios),
             "timestamp": datetime.now().isoformat()
         }
@@ -735,6 +1278,8 @@ class FamilyInheritanceExperiment:
         # Record the conversation in metrics tracker
         self._record_crewai_conversation(scenario_event, result)
         
+        result_str = str(result)
+        
         # Display the full CrewAI conversation and decisions
         logger.info("\n" + "="*80)
         logger.info("🤖 CREWAI CONVERSATION & DECISIONS")
@@ -744,19 +1289,19 @@ class FamilyInheritanceExperiment:
         logger.info("-"*80)
         logger.info("💬 FULL CONVERSATION OUTPUT:")
         logger.info("-"*80)
-        logger.info(str(result))
+        logger.info("%s", result_str)
         logger.info("-"*80)
         
         # Extract and display key decisions and outcomes
-        result_str = str(result)
         logger.info("📊 KEY DECISIONS & OUTCOMES:")
         logger.info("-"*80)
         
         # Try to extract key sections from the result
-        if "Final Decision" in result_str or "Unanimous Decision" in result_str:
+        decision_match = _DECISION_LINE_RE.search(result_str) if logger.isEnabledFor(logging.INFO) else None
+        if decision_match:
             logger.info("🎯 FINAL DECISION:")
-            # Extract decision section (simplified extraction)
-            lines = result_str.split('\n')
+            # Extract decision section (simplified extraction), starting at its first line
+            lines = result_str[decision_match.start():].split('\n')
             in_decision_section = False
             for line in lines:
                 if "Final Decision" in line or "Unanimous Decision" in line:
@@ -769,16 +1314,16 @@ class FamilyInheritanceExperiment:
         
         logger.info("-"*80)
         
-        # Display individual agent contributions if available
+        # Display individual agent contributions if available (skipped when INFO logging is off)
         try:
-            if hasattr(self.crew, 'tasks') and self.crew.tasks:
+            if logger.isEnabledFor(logging.INFO) and hasattr(self.crew, 'tasks') and self.crew.tasks:
                 logger.info("👥 INDIVIDUAL AGENT CONTRIBUTIONS:")
                 logger.info("-"*80)
                 for i, task in enumerate(self.crew.tasks):
                     if hasattr(task, 'output') and task.output:
                         logger.info(f"🤖 Agent {i+1} ({task.agent.role if hasattr(task, 'agent') else 'Unknown'}):")
-                        logger.info(f"   Task: {task.description}")
-                        logger.info(f"   Output: {str(task.output)}")
+                        logger.info("   Task: %s", task.description)
+                        logger.info("   Output: %s", task.output)
                         logger.info("-"*40)
         except Exception as e:
             logger.info(f"⚠️  Could not display individual agent contributions: {e}")
@@ -791,7 +1336,7 @@ class FamilyInheritanceExperiment:
             "scenario": scenario_event.title,
             "month": scenario_event.month,
             "week": scenario_event.week,
-            "result": str(result),
+            "result": result_str,
             "timestamp": datetime.now().isoformat(),
             "resource_impact": scenario_event.resource_impact
         }
@@ -802,7 +1347,7 @@ class FamilyInheritanceExperiment:
         self._update_relationship_dynamics(scenario_outcome)
         
         # Apply resource impact with individual contributions
-        self._apply_resource_impact(scenario_event.resource_impact, scenario_event.title, str(result))
+        self._apply_resource_impact(scenario_event.resource_impact, scenario_event.title, result_str)
         
         # Record metrics
         self._record_scenario_metrics(scenario_event, result)
@@ -855,49 +1400,87 @@ class FamilyInheritanceExperiment:
     def _record_scenario_metrics(self, scenario_event, result):
         """Record metrics after scenario completion"""
         # Record scenario metrics and behavioral patterns
-        month = scenario_event.month
-        
-        for cousin_id in self.cousins.keys():
+        for cousin_id, metrics in self._compute_all_metrics(scenario_event.month).items():
+            self.metrics_tracker.record_quantitative_metrics(cousin_id, metrics)
+    
+    def _compute_all_metrics(self, month: int) -> Dict[str, Dict[str, Any]]:
+        """Calculate every cousin's metrics for a month in one pass over the month's data"""
+        # Walk the month's scenarios and behaviors once; the keyword-based scores are the
+        # same for every cousin, so they are totalled up front
+        month_scenarios = self._scenarios_by_month.get(month, ())
+        month_keyword_scores = [self._scenario_keyword_scores_for(scenario) for scenario in month_scenarios]
+        month_financial_score = 0.0
+        month_opportunity_count = 0
+        for scores in month_keyword_scores:
+            month_financial_score += scores['financial']
+            month_opportunity_count += scores['opportunities']
+        
+        month_behaviors = defaultdict(list)
+        for behavior in self.metrics_tracker.get_behavioral_patterns(month):
+            month_behaviors[behavior.cousin_id].append(behavior)
+        
+        all_metrics = {}
+        for cousin_id in self._cousin_ids:
+            cousin_behaviors = month_behaviors.get(cousin_id, ())
+            
             # Calculate comprehensive metrics
-            metrics = {
-                "financial_returns": self._calculate_financial_returns(cousin_id, month),
-                "social_capital": self._calculate_social_capital(cousin_id, month),
+            all_metrics[cousin_id] = {
+                "financial_returns": self._calculate_financial_returns(
+                    cousin_id, month_financial_score=month_financial_score),
+                "social_capital": self._calculate_social_capital(
+                    cousin_id, month_behaviors=cousin_behaviors),
                 "reputation_score": self.resource_manager.cousin_resources[cousin_id].reputation_points,
-                "influence_index": self._calculate_influence_index(cousin_id, month),
-                "future_opportunities": self._calculate_future_opportunities(cousin_id, month)
+                "influence_index": self._calculate_influence_index(
+                    cousin_id, month_behaviors=cousin_behaviors, month_keyword_scores=month_keyword_scores),
+                "future_opportunities": self._calculate_future_opportunities(
+                    cousin_id, month_opportunity_count=month_opportunity_count)
             }
-            
-            self.metrics_tracker.record_quantitative_metrics(cousin_id, metrics)
+        
+        return all_metrics
     
-    def _calculate_financial_returns(self, cousin_id: str, month: int) -> float:
+    def _calculate_financial_returns(self, cousin_id: str, *, month_financial_score: float) -> float:
         """Calculate financial returns based on business decisions and resource management"""
         # Base calculation on money earned vs spent
         current_money = self.resource_manager.cousin_resources[cousin_id].money
         
-        # Get scenarios from this month to analyze financial impact
-        month_scenarios = [s for s in self.scenario_history if s['month'] == month]
-        
         # Calculate based on resource impact and business decisions
-        financial_score = 0.0
-        
-        for scenario in month_scenarios:
-            # Look for financial keywords in the scenario
-            result_str = str(scenario.get('result', '')).lower()
-            
-            # Positive financial indicators
-            if any(word in result_str for word in ['profit', 'revenue', 'income', 'earn', 'gain', 'success']):
-                financial_score += 100.0
-            elif any(word in result_str for word in ['budget', 'cost', 'expense', 'spend', 'invest']):
-                financial_score += 50.0
-            elif any(word in result_str for word in ['grant', 'funding', 'sponsor', 'donation']):
-                financial_score += 75.0
+        # (financial keywords in this month's scenarios)
+        financial_score = month_financial_score
         
         # Add current money as a factor
         financial_score += current_money * 0.1
         
         return round(financial_score, 2)
     
-    def _calculate_social_capital(self, cousin_id: str, month: int) -> int:
+    def _scenario_keyword_scores_for(self, scenario: Dict[str, Any]) -> Dict[str, Any]:
+        """Score a scenario's result text against the keyword indicators (cached per scenario)"""
+        scores = self._scenario_keyword_scores.get(id(scenario))
+        if scores is not None:
+            return scores
+        
+        raw_result = str(scenario.get('result', ''))
+        result_str = raw_result.lower()
+        
+        # Positive financial indicators take precedence over spending and funding ones
+        if _POSITIVE_FINANCIAL_RE.search(result_str):
+            financial = 100.0
+        elif _SPENDING_RE.search(result_str):
+            financial = 50.0
+        elif _FUNDING_RE.search(result_str):
+            financial = 75.0
+        else:
+            financial = 0.0
+        
+        scores = {
+            "financial": financial,
+            "opportunities": sum(1 for pattern in _OPPORTUNITY_RES if pattern.search(result_str)),
+            # "C1:"-style mentions of every cousin, counted in a single pass
+            "mentions": Counter(self._cousin_mention_re.findall(raw_result))
+        }
+        self._scenario_keyword_scores[id(scenario)] = scores
+        return scores
+    
+    def _calculate_social_capital(self, cousin_id: str, *, month_behaviors) -> int:
         """Calculate social capital based on alliances and trust levels"""
         # Count alliances and trust relationships
         social_score = 0
@@ -907,15 +1490,12 @@ class FamilyInheritanceExperiment:
         social_score += len(alliances) * 10
         
         # Calculate average trust level
-        trust_levels = self.relationship_dynamics[cousin_id].get('trust_levels', {})
-        if trust_levels:
-            avg_trust = sum(trust_levels.values()) / len(trust_levels)
+        i = self._cousin_index[cousin_id]
+        if self._trust_established[i]:
+            avg_trust = self._trust[i, self._off_diagonal[i]].mean()
             social_score += int(avg_trust * 50)
         
         # Count behavioral patterns that indicate social behavior
-        month_behaviors = [b for b in self.metrics_tracker.behavioral_patterns 
-                          if b.cousin_id == cousin_id and b.month == month]
-        
         for behavior in month_behaviors:
             if behavior.behavior_type in ['collaboration', 'cooperation', 'leadership']:
                 social_score += 5
@@ -924,14 +1504,11 @@ class FamilyInheritanceExperiment:
         
         return max(0, social_score)
     
-    def _calculate_influence_index(self, cousin_id: str, month: int) -> float:
+    def _calculate_influence_index(self, cousin_id: str, *, month_behaviors, month_keyword_scores: List[Dict[str, Any]]) -> float:
         """Calculate influence index based on leadership behaviors and proposal success"""
         influence_score = 0.0
         
         # Count leadership behaviors
-        month_behaviors = [b for b in self.metrics_tracker.behavioral_patterns 
-                          if b.cousin_id == cousin_id and b.month == month]
-        
         for behavior in month_behaviors:
             if behavior.behavior_type == 'leadership':
                 influence_score += 0.3
@@ -947,39 +1524,22 @@ class FamilyInheritanceExperiment:
         influence_score += len(alliances) * 0.1
         
         # Count scenarios where this cousin was mentioned prominently
-        month_scenarios = [s for s in self.scenario_history if s['month'] == month]
-        for scenario in month_scenarios:
-            result_str = str(scenario.get('result', ''))
+        for scores in month_keyword_scores:
             # Count mentions of this cousin
-            mentions = result_str.count(f"{cousin_id}:")
-            influence_score += mentions * 0.05
+            influence_score += scores['mentions'][cousin_id] * 0.05
         
         return round(min(1.0, influence_score), 3)
     
-    def _calculate_future_opportunities(self, cousin_id: str, month: int) -> int:
+    def _calculate_future_opportunities(self, cousin_id: str, *, month_opportunity_count: int) -> int:
         """Calculate future opportunities based on scenario outcomes and relationships"""
-        opportunities = 0
-        
-        # Count positive scenario outcomes
-        month_scenarios = [s for s in self.scenario_history if s['month'] == month]
-        
-        for scenario in month_scenarios:
-            result_str = str(scenario.get('result', '')).lower()
-            
-            # Look for opportunity indicators
-            if any(word in result_str for word in ['future', 'next', 'plan', 'opportunity', 'potential']):
-                opportunities += 1
-            
-            if any(word in result_str for word in ['meeting', 'schedule', 'follow', 'continue']):
-                opportunities += 1
-            
-            if any(word in result_str for word in ['partnership', 'collaboration', 'team', 'together']):
-                opportunities += 1
+        # Count positive scenario outcomes (opportunity indicators)
+        opportunities = month_opportunity_count
         
         # Add opportunities based on trust levels
-        trust_levels = self.relationship_dynamics[cousin_id].get('trust_levels', {})
-        high_trust_count = sum(1 for trust in trust_levels.values() if trust > 0.7)
-        opportunities += high_trust_count
+        i = self._cousin_index[cousin_id]
+        if self._trust_established[i]:
+            # The diagonal is always 0.0, so it never counts as high trust
+            opportunities += int(np.count_nonzero(self._trust[i] > 0.7))
         
         # Add opportunities based on reputation
         reputation = self.resource_manager.cousin_resources[cousin_id].reputation_points
@@ -1004,11 +1564,7 @@ class FamilyInheritanceExperiment:
         logger.info("=" * 60)
         
         # Force CrewAI to use GPT-2 on Hugging Face by setting environment variable
-        huggingface_key = os.getenv('HF_TOKEN')
-        if huggingface_key:
-            os.environ['OPENAI_API_KEY'] = huggingface_key
-            logger.info("🔧 Configured CrewAI to use GPT-2 on Hugging Face")
-            logger.info("🔑 Set Hugging Face API key for CrewAI compatibility")
+        _configure_llm_env()
         
         # Setup
         logger.info("⚙️  Setting up crew...")
@@ -1031,17 +1587,14 @@ class FamilyInheritanceExperiment:
                 self._load_all_previous_months_context(month - 1)
             
             # Get events for this month
-            month_events = [event for event in self.timeline.events 
-                          if event.month == month]
+            month_events = self.timeline.get_events_for_month(month)
             
             for event in month_events:
                 logger.info(f"🔄 Running scenario: {event.title}")
                 outcome = self.run_scenario(event)
                 logger.info(f"✅ Scenario completed: {event.title}")
                 
-                # Add delay between scenarios to prevent API overload
-                logger.info("⏳ Waiting between scenarios to respect API limits...")
-                time.sleep(30)  # 30 second delay between scenarios (increased from 10)
+                # API pacing is handled per request by the rate limiter, so no fixed delay here
                 
                 # Advance week
                 self.timeline.advance_week()
@@ -1060,11 +1613,9 @@ class FamilyInheritanceExperiment:
             
             # Save complete experiment state after each month
             self.save_experiment_state()
-            
-            # Add delay between months to prevent API overload
-            if month < 6:  # Don't wait after the last month
-                logger.info("⏳ Waiting between months to respect API limits...")
-                time.sleep(60)  # 60 second delay between months (increased from 30)
+        
+        # Make sure the last month's state is on disk and stop the state writer before reporting
+        self.close()
         
         # Final analysis
         logger.info("📊 Generating final report...")
@@ -1083,7 +1634,7 @@ class FamilyInheritanceExperiment:
         
         # Resource summary
         logger.info("\n📊 Final Resource Status:")
-        for cousin_id in self.cousins.keys():
+        for cousin_id in self._cousin_ids:
             status = self.resource_manager.get_resource_status(cousin_id)
             logger.info(f"   {cousin_id}: {status}")
         
@@ -1096,8 +1647,7 @@ class FamilyInheritanceExperiment:
         
         # Export experiment data
         logger.info("💾 Exporting experiment data...")
-        with open(self.data_file, "w") as f:
-            json.dump(self.experiment_data, f, indent=2)
+        _write_json(self.data_file, self.experiment_data)
         
         logger.info(f"\n📄 Experiment data exported to:")
         logger.info(f"   📁 {self.output_dir}/")
@@ -1115,13 +1665,8 @@ class FamilyInheritanceExperiment:
             if decisions:  # Only add non-empty decisions
                 all_decisions.extend(decisions)
         
-        # Remove duplicates while preserving order
-        unique_decisions = []
-        seen = set()
-        for decision in all_decisions:
-            if decision not in seen:
-                unique_decisions.append(decision)
-                seen.add(decision)
+        # Remove duplicates while preserving order (decisions are strings)
+        unique_decisions = list(dict.fromkeys(all_decisions))
         
         # Update the top-level decisions_made array
         self.experiment_data["decisions_made"] = unique_decisions
@@ -1156,23 +1701,15 @@ class FamilyInheritanceExperiment:
                         "legal_fund": self.resource_manager.shared_resources.legal_fund
                     }
                 },
-                "relationship_dynamics": self.relationship_dynamics,
+                "relationship_dynamics": self._relationship_dynamics_state(),
                 "scenario_history": self.scenario_history,
                 "experiment_data": self.experiment_data,
                 "metrics_tracker": {
                     "current_month": self.metrics_tracker.current_month,
-                            "quantitative_metrics": [
-                                {
-                                    "cousin_id": m.cousin_id,
-                                    "month": m.month,
-                                    "financial_returns": m.financial_returns,
-                                    "social_capital": m.social_capital,
-                                    "reputation_score": m.reputation_score,
-                                    "influence_index": m.influence_index,
-                                    "future_opportunities": m.future_opportunities
-                                }
-                                for m in self.metrics_tracker.quantitative_metrics
-                            ],
+                    "quantitative_metrics": [
+                        m.to_dict()
+                        for m in self.metrics_tracker.quantitative_metrics
+                    ],
                     "conversation_logs": [
                         log.to_dict()
                         for log in self.metrics_tracker.conversation_logs
@@ -1181,34 +1718,41 @@ class FamilyInheritanceExperiment:
                 "last_saved": datetime.now().isoformat()
             }
             
-            with open(self.state_file, 'w') as f:
-                json.dump(state, f, indent=2)
-            
-            logger.info(f"💾 Experiment state saved to {self.state_file}")
-            
-        except AttributeError as e:
-            if "social_connections" in str(e):
-                logger.error(f"❌ Error saving experiment state: {e}")
-                logger.error("🔧 This error suggests there's a mismatch between ResourcePool and CousinAgent objects")
-                logger.error("💡 The social_connections attribute belongs to CousinAgent, not ResourcePool")
-                # Create a minimal state file to prevent complete failure
-                minimal_state = {
-                    "timeline": {
-                        "current_month": self.timeline.current_month,
-                        "current_week": self.timeline.current_week
-                    },
-                    "error": f"State save failed due to attribute error: {e}",
-                    "last_saved": datetime.now().isoformat()
-                }
-                with open(self.state_file, 'w') as f:
-                    json.dump(minimal_state, f, indent=2)
-                logger.info(f"💾 Minimal state saved to {self.state_file}")
-            else:
-                raise
+            # Serialize now, while nothing can change under us; only the disk writes go to the background
+            files = [(self.state_file, _json_bytes(state))]
+            if self._analysis_cache is not None:
+                files.append((self.analysis_cache_file, _json_bytes(self._analysis_cache)))
+            
+            self.wait_for_pending_save()
+            if self._io_pool is None:
+                self._io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="state-writer")
+            self._pending_save = self._io_pool.submit(self._write_state_files, files)
+            
         except Exception as e:
             logger.error(f"❌ Unexpected error saving experiment state: {e}")
             raise
 
+    def _write_state_files(self, files: List[tuple]):
+        """Write serialized state files to disk (runs on the state-writer thread)"""
+        for path, payload in files:
+            _write_bytes(path, payload)
+        logger.info(f"💾 Experiment state saved to {files[0][0]}")
+    
+    def wait_for_pending_save(self):
+        """Block until the last background state save is on disk, re-raising any write error"""
+        if self._pending_save is not None:
+            future, self._pending_save = self._pending_save, None
+            future.result()
+    
+    def close(self):
+        """Wait for the last background state save to reach disk and stop the state writer"""
+        try:
+            self.wait_for_pending_save()
+        finally:
+            if self._io_pool is not None:
+                self._io_pool.shutdown(wait=True)
+                self._io_pool = None
+    
     def _record_crewai_conversation(self, scenario_event, result):
         """Record CrewAI conversation in metrics tracker"""
         try:
@@ -1216,62 +1760,63 @@ class FamilyInheritanceExperiment:
             result_str = str(result)
             
             # Get all cousin IDs
-            participants = list(self.cousins.keys())
+            participants = list(self._cousin_ids)
             
             # Extract key points from the conversation
             key_points = []
             decisions_made = []
             influence_tactics = []
             
-            # Convert to lowercase for case-insensitive matching
+            # Convert to lowercase for case-insensitive matching, then find every keyword in one pass
             result_lower = result_str.lower()
+            found = _CONVERSATION_KEYWORDS.find(result_lower)
             
             # Try to extract decision sections
-            if "final decision" in result_lower or "unanimous decision" in result_lower:
+            if "final decision" in found or "unanimous decision" in found:
                 decisions_made.append("Unanimous decision reached")
-            elif "decision" in result_lower and ("agree" in result_lower or "consensus" in result_lower):
+            elif "decision" in found and ("agree" in found or "consensus" in found):
                 decisions_made.append("Consensus decision reached")
-            elif "decide" in result_lower and ("plan" in result_lower or "approach" in result_lower):
+            elif "decide" in found and ("plan" in found or "approach" in found):
                 decisions_made.append("Planning decision made")
-            elif "outcome" in result_lower or "result" in result_lower:
+            elif "outcome" in found or "result" in found:
                 decisions_made.append("Outcome determined")
             
             # Extract key points with more comprehensive keyword detection
-            if "phase" in result_lower or "phased" in result_lower:
+            if "phase" in found or "phased" in found:
                 key_points.append("Phased approach discussed")
             
-            if "budget" in result_lower or "resource" in result_lower or "financial" in result_lower:
+            if "budget" in found or "resource" in found or "financial" in found:
                 key_points.append("Resource allocation planned")
             
-            if "technology" in result_lower or "digital" in result_lower:
+            if "technology" in found or "digital" in found:
                 key_points.append("Technology integration discussed")
             
-            if "community" in result_lower or "outreach" in result_lower:
+            if "community" in found or "outreach" in found:
                 key_points.append("Community engagement planned")
             
-            if "legal" in result_lower or "lawyer" in result_lower or "consultation" in result_lower:
+            if "legal" in found or "lawyer" in found or "consultation" in found:
                 key_points.append("Legal consultation planned")
             
-            if "renovation" in result_lower or "repair" in result_lower or "renovate" in result_lower:
+            if "renovation" in found or "repair" in found or "renovate" in found:
                 key_points.append("Renovation and repairs discussed")
             
-            if "grant" in result_lower or "funding" in result_lower or "sponsorship" in result_lower:
+            if "grant" in found or "funding" in found or "sponsorship" in found:
                 key_points.append("Funding options explored")
             
-            if "meeting" in result_lower or "schedule" in result_lower:
+            if "meeting" in found or "schedule" in found:
                 key_points.append("Future meetings planned")
             
             # Extract influence tactics
-            if "agree" in result_lower or "support" in result_lower:
+            if "agree" in found or "support" in found:
                 influence_tactics.append("Consensus building")
             
-            if "suggest" in result_lower or "propose" in result_lower:
+            if "suggest" in found or "propose" in found:
                 influence_tactics.append("Proposal making")
             
-            if "concern" in result_lower or "caution" in result_lower:
+            if "concern" in found or "caution" in found:
                 influence_tactics.append("Risk assessment")
             
-            if "vision" in result_lower or "creative" in result_lower:
+            if "vision" in found or "creative" in found:
                 influence_tactics.append("Vision articulation")
             
             # Log what was extracted for debugging
@@ -1280,612 +1825,315 @@ class FamilyInheritanceExperiment:
             logger.info(f"   Decisions made: {len(decisions_made)} - {decisions_made}")
             logger.info(f"   Influence tactics: {len(influence_tactics)} - {influence_tactics}")
             
-            # Record conversation for each participant
-            for cousin_id in participants:
-                self.metrics_tracker.record_conversation(
-                    participants=participants,
-                    conversation_type="scenario_discussion",
-                    topic=scenario_event.title,
-                    key_points=key_points,
-                    decisions_made=decisions_made,
-                    influence_tactics=influence_tactics,
-                    month=scenario_event.month
-                )
+            # Record the conversation once; the log already lists every participant
+            self.metrics_tracker.record_conversation(
+                participants=participants,
+                conversation_type="scenario_discussion",
+                topic=scenario_event.title,
+                key_points=key_points,
+                decisions_made=decisions_made,
+                influence_tactics=influence_tactics,
+                month=scenario_event.month
+            )
             
             logger.info(f"📝 Recorded conversation for scenario: {scenario_event.title}")
             
         except Exception as e:
             logger.error(f"❌ Failed to record conversation: {e}")
 
-    def _extract_conflicts_from_result(self, result_str: str, scenario_name: str, month: int) -> List[Dict]:
-        """Extract conflicts from CrewAI conversation result using LLM analysis"""
-        conflicts = []
-        
-        try:
-            # Use LLM to analyze conflicts in the conversation
-            conflict_analysis_prompt = f"""
-            Analyze the following family conversation for conflicts, tensions, or disagreements between the cousins (C1, C2, C3, C4).
-            
-            Conversation from scenario: {scenario_name}
-            
-            {result_str}
-            
-            Please identify any conflicts, tensions, or disagreements between the cousins based on their interactions, statements, and behavior.
-            Look for:
-            - Direct disagreements or arguments
-            - Tension or opposition between cousins
-            - Competing interests or conflicting viewpoints
-            - Hostile or confrontational language
-            - Unresolved disputes or clashes
-            - Passive-aggressive behavior or subtle tensions
-            - Power struggles or dominance attempts
-            
-            Respond with a JSON array of conflicts, where each conflict has:
-            - "involved": array of cousin IDs involved in the conflict (e.g., ["C1", "C2"])
-            - "type": type of conflict (e.g., "disagreement", "tension", "argument", "opposition", "power_struggle")
-            - "severity": severity level ("low", "medium", "high")
-            - "reason": brief explanation of what the conflict is about
-            - "confidence": confidence level from 0.0 to 1.0
-            
-            Example format:
-            [
-                {{
-                    "involved": ["C1", "C2"],
-                    "type": "disagreement",
-                    "severity": "medium",
-                    "reason": "C1 and C2 disagreed about budget allocation priorities",
-                    "confidence": 0.8
-                }}
-            ]
-            
-            If no conflicts are detected, return an empty array: []
-            """
-            
-            # Apply rate limiting before API call
-            rate_limiter.wait_if_needed()
-            
-            # Use the shared LLM to analyze conflicts
-            response = self.shared_llm.call(conflict_analysis_prompt)
+    def _response_text(self, response: Any) -> str:
+        """Get the text of an LLM response, detecting the response format once"""
+        if self._response_to_text is None:
             # Handle different response formats from CrewAI LLM
             if hasattr(response, 'content'):
-                response_text = str(response.content)
+                self._response_to_text = lambda r: str(r.content)
             elif hasattr(response, 'text'):
-                response_text = str(response.text)
+                self._response_to_text = lambda r: str(r.text)
             else:
-                response_text = str(response)
-            
-            # Parse the JSON response
-            import json
-            try:
-                # Extract JSON from response (handle cases where LLM adds extra text)
-                start_idx = response_text.find('[')
-                end_idx = response_text.rfind(']') + 1
-                if start_idx != -1 and end_idx != -1:
-                    json_str = response_text[start_idx:end_idx]
-                    conflict_analysis = json.loads(json_str)
-                    
-                    # Convert to our format
-                    for analysis in conflict_analysis:
-                        if analysis.get('confidence', 0) > 0.5:  # Only include high-confidence conflicts
-                            conflicts.append({
-                                "type": analysis.get("type", "disagreement"),
-                                "involved": analysis.get("involved", []),
-                                "context": f"LLM-analyzed conflict in {scenario_name}",
-                                "severity": analysis.get("severity", "medium"),
-                                "reason": analysis.get("reason", "No reason provided"),
-                                "confidence": analysis.get("confidence", 0.5),
-                                "month": month,
-                                "timestamp": datetime.now().isoformat()
-                            })
-                            
-            except json.JSONDecodeError as e:
-                logger.warning(f"Failed to parse LLM conflict analysis JSON: {e}")
-                logger.warning(f"LLM response: {response_text}")
+                self._response_to_text = str
+        return self._response_to_text(response)
+    
+    def _request_social_analysis(self, result_str: str, scenario_name: str) -> Optional[Dict[str, Any]]:
+        """Get the LLM's combined social analysis of a conversation, reusing cached analyses when replay is enabled"""
+        # Replay only ever matches a byte-identical transcript, so key the cache on the prompt inputs
+        cache_key = None
+        if self._analysis_cache is not None:
+            cache_key = hashlib.blake2b(f"{scenario_name}\n{result_str}".encode('utf-8'), digest_size=16).hexdigest()
+            cached_analysis = self._analysis_cache.get(cache_key)
+            if cached_analysis is not None:
+                self._analysis_cache.move_to_end(cache_key)
+                logger.info(f"♻️ Replaying cached social analysis for {scenario_name} instead of calling the LLM")
+                return cached_analysis
+        
+        # Use one LLM call to analyze all relationship signals in the conversation
+        social_analysis_prompt = _SOCIAL_ANALYSIS_PROMPT.format(scenario_name=scenario_name, result_str=result_str)
+        
+        # Apply rate limiting before API call
+        rate_limiter.wait_if_needed()
+        
+        # Use the shared LLM to analyze the conversation
+        response = self.shared_llm.call(social_analysis_prompt)
+        response_text = self._response_text(response)
+        
+        # Parse the JSON response (handle cases where LLM adds extra text)
+        social_analysis = _parse_json_object(response_text)
+        if social_analysis is None:
+            logger.warning("Failed to parse LLM social analysis JSON: no valid JSON object in response")
+            logger.warning(f"LLM response: {response_text}")
+            return None
+        
+        if self._analysis_cache is not None:
+            self._analysis_cache[cache_key] = social_analysis
+            if len(self._analysis_cache) > _ANALYSIS_CACHE_SIZE:
+                self._analysis_cache.popitem(last=False)
+        return social_analysis
+    
+    def _extract_all_social_signals(self, result_str: str, scenario_name: str, month: int) -> Dict[str, List[Dict]]:
+        """Extract conflicts, alliances, trust changes and behavioral patterns from a CrewAI result with one LLM call"""
+        signals = {"conflicts": [], "alliances": [], "trust_changes": [], "behavioral_patterns": []}
+        
+        # Skip the LLM entirely when there is nothing to analyze
+        if len(result_str) < _MIN_ANALYSIS_LENGTH or not self._cousin_id_re.search(result_str):
+            logger.info(f"⏭️ Skipping social analysis for {scenario_name}: transcript too short or mentions no cousins")
+            return signals
+        
+        try:
+            social_analysis = self._request_social_analysis(result_str, scenario_name)
+            if social_analysis is not None:
+                # One timestamp for every signal extracted from this result
+                timestamp = datetime.now().isoformat()
+                # Convert to our format, only including high-confidence signals
+                for analysis in social_analysis.get("conflicts", []):
+                    if analysis.get('confidence', 0) > 0.5:
+                        signals["conflicts"].append({
+                            "type": analysis.get("type", "disagreement"),
+                            "involved": analysis.get("involved", []),
+                            "context": f"LLM-analyzed conflict in {scenario_name}",
+                            "severity": analysis.get("severity", "medium"),
+                            "reason": analysis.get("reason", "No reason provided"),
+                            "confidence": analysis.get("confidence", 0.5),
+                            "month": month,
+                            "timestamp": timestamp
+                        })
+                
+                for analysis in social_analysis.get("alliances", []):
+                    if analysis.get('confidence', 0) > 0.5:
+                        signals["alliances"].append({
+                            "type": analysis.get("type", "collaboration"),
+                            "involved": analysis.get("involved", []),
+                            "context": f"LLM-analyzed alliance in {scenario_name}",
+                            "strength": analysis.get("strength", "medium"),
+                            "reason": analysis.get("reason", "No reason provided"),
+                            "confidence": analysis.get("confidence", 0.5),
+                            "month": month,
+                            "timestamp": timestamp
+                        })
+                
+                for analysis in social_analysis.get("trust_changes", []):
+                    if analysis.get('confidence', 0) > 0.5:
+                        signals["trust_changes"].append({
+                            "cousin": analysis.get("cousin"),
+                            "target_cousin": analysis.get("target_cousin"),
+                            "change": analysis.get("change"),
+                            "reason": analysis.get("reason"),
+                            "confidence": analysis.get("confidence"),
+                            "context": f"LLM-analyzed trust change in {scenario_name}",
+                            "month": month,
+                            "timestamp": timestamp
+                        })
+                
+                for analysis in social_analysis.get("behavioral_patterns", []):
+                    if analysis.get('confidence', 0) > 0.5:
+                        signals["behavioral_patterns"].append({
+                            "cousin_id": analysis.get("cousin"),
+                            "behavior_type": analysis.get("behavior_type", "unknown"),
+                            "context": f"LLM-analyzed behavior in {scenario_name}",
+                            "description": analysis.get("description", "No description provided"),
+                            "outcome": analysis.get("impact", "neutral"),
+                            "confidence": analysis.get("confidence", 0.5),
+                            "month": month,
+                            "timestamp": timestamp
+                        })
                 
         except Exception as e:
-            logger.error(f"Error in LLM conflict analysis: {e}")
+            logger.error(f"Error in LLM social analysis: {e}")
             # Fallback to simple keyword detection if LLM analysis fails
-            conflicts = self._fallback_conflict_analysis(result_str, scenario_name, month)
+            logger.info("🔄 Falling back to keyword-based relationship and behavioral analysis...")
+            # Lowercase the transcript once for all keyword matching; its line layout is shared too
+            result_lower = result_str.lower()
+            lines = _TranscriptLines(result_str, result_lower)
+            signals = {
+                "conflicts": self._fallback_conflict_analysis(
+                    result_str, result_lower, lines, scenario_name, month),
+                "alliances": self._fallback_alliance_analysis(
+                    result_str, result_lower, lines, scenario_name, month),
+                "trust_changes": self._fallback_trust_analysis(
+                    result_str, result_lower, lines, scenario_name, month),
+                "behavioral_patterns": self._fallback_behavioral_patterns_analysis(
+                    result_str, result_lower, lines, scenario_name, month)
+            }
+            logger.info(f"📊 Fallback analysis found {len(signals['behavioral_patterns'])} behavioral patterns")
         
-        return conflicts
+        logger.info(f"📊 Total behavioral patterns extracted: {len(signals['behavioral_patterns'])}")
+        return signals
     
-    def _fallback_conflict_analysis(self, result_str: str, scenario_name: str, month: int) -> List[Dict]:
+    def _fallback_conflict_analysis(self, result_str: str, result_lower: str, lines: _TranscriptLines,
+                                    scenario_name: str, month: int) -> List[Dict]:
         """Fallback conflict analysis using simple keyword detection"""
         conflicts = []
-        
-        # Look for conflict indicators in the conversation
-        conflict_keywords = [
-            "disagreement", "conflict", "tension", "opposition", "dispute", "argument", "clash", "rivalry",
-            "fight", "battle", "struggle", "compete", "against", "versus", "but", "however", "disagree",
-            "don't agree", "can't agree", "won't work", "not right", "wrong", "mistake", "problem"
-        ]
-        
-        # Look for direct opposition patterns between specific cousins
-        opposition_patterns = [
-            ("C1", "C2"), ("C1", "C3"), ("C1", "C4"),
-            ("C2", "C3"), ("C2", "C4"), ("C3", "C4")
-        ]
+        # Fields shared by every record; each record is a copy with its own details filled in
+        template = {
+            "type": "disagreement",
+            "involved": None,
+            "context": f"Fallback conflict detection in {scenario_name}",
+            "severity": "medium",
+            "reason": None,
+            "confidence": 0.3,  # Lower confidence for fallback
+            "month": month,
+            "timestamp": datetime.now().isoformat()
+        }
         
         # Check for explicit disagreements between specific cousins
-        for cousin1, cousin2 in opposition_patterns:
+        for cousin1, cousin2, patterns in _OPPOSITION_PATTERNS:
             # Look for patterns like "C1: ... but C2: ..." or "C1: ... C2: No, ..."
-            import re
-            pattern1 = f"{cousin1}:.*{cousin2}:"
-            pattern2 = f"{cousin2}:.*{cousin1}:"
-            pattern3 = f"{cousin1}.*{cousin2}.*disagree"
-            pattern4 = f"{cousin2}.*{cousin1}.*disagree"
-            
-            if (re.search(pattern1, result_str, re.IGNORECASE | re.DOTALL) or 
-                re.search(pattern2, result_str, re.IGNORECASE | re.DOTALL) or
-                re.search(pattern3, result_str, re.IGNORECASE) or
-                re.search(pattern4, result_str, re.IGNORECASE)):
-                
-                conflicts.append({
-                    "type": "disagreement",
-                    "involved": [cousin1, cousin2],
-                    "context": f"Fallback conflict detection in {scenario_name}",
-                    "severity": "medium",
-                    "reason": f"Direct opposition pattern detected between {cousin1} and {cousin2}",
-                    "confidence": 0.4,
-                    "month": month,
-                    "timestamp": datetime.now().isoformat()
-                })
+            if any(pattern.search(result_str) for pattern in patterns):
+                conflict = template.copy()
+                conflict["involved"] = [cousin1, cousin2]
+                conflict["reason"] = f"Direct opposition pattern detected between {cousin1} and {cousin2}"
+                conflict["confidence"] = 0.4
+                conflicts.append(conflict)
         
         # Check for general conflict keywords
-        for keyword in conflict_keywords:
-            if keyword.lower() in result_str.lower():
+        found = _CONFLICT_KEYWORDS.find_offsets(result_lower)
+        for keyword in _CONFLICT_KEYWORDS.keywords:
+            if keyword in found:
                 # Try to identify which cousins are involved
-                involved_cousins = self._identify_involved_cousins(result_str, keyword)
+                involved_cousins = self._identify_involved_cousins(lines, found[keyword])
                 if len(involved_cousins) >= 2:
-                    conflicts.append({
-                        "type": "disagreement",
-                        "involved": involved_cousins,
-                        "context": f"Fallback conflict detection in {scenario_name}",
-                        "severity": "medium",
-                        "reason": f"Keyword '{keyword}' detected",
-                        "confidence": 0.3,  # Lower confidence for fallback
-                        "month": month,
-                        "timestamp": datetime.now().isoformat()
-                    })
+                    conflict = template.copy()
+                    conflict["involved"] = involved_cousins
+                    conflict["reason"] = f"Keyword '{keyword}' detected"
+                    conflicts.append(conflict)
         
         return conflicts
 
-    def _extract_alliances_from_result(self, result_str: str, scenario_name: str, month: int) -> List[Dict]:
-        """Extract alliances from CrewAI conversation result using LLM analysis"""
-        alliances = []
-        
-        try:
-            # Use LLM to analyze alliances in the conversation
-            alliance_analysis_prompt = f"""
-            Analyze the following family conversation for alliances, collaborations, or partnerships between the cousins (C1, C2, C3, C4).
-            
-            Conversation from scenario: {scenario_name}
-            
-            {result_str}
-            
-            Please identify any alliances, collaborations, or partnerships between the cousins based on their interactions, statements, and behavior.
-            Look for:
-            - Explicit agreements or mutual support
-            - Collaborative decision-making or joint proposals
-            - Mutual backing or endorsement of ideas
-            - Working together toward common goals
-            - Defending each other's positions
-            - Building on each other's ideas
-            - Shared interests or aligned viewpoints
-            - Implicit support or solidarity
-            - Coalition formation or teaming up
-            - Complementary roles or division of labor
-            
-            Respond with a JSON array of alliances, where each alliance has:
-            - "involved": array of cousin IDs involved in the alliance (e.g., ["C1", "C2"])
-            - "type": type of alliance (e.g., "collaboration", "support", "partnership", "coalition", "mutual_backing")
-            - "strength": strength level ("weak", "medium", "strong")
-            - "reason": brief explanation of what the alliance is about
-            - "confidence": confidence level from 0.0 to 1.0
-            
-            Example format:
-            [
-                {{
-                    "involved": ["C1", "C2"],
-                    "type": "collaboration",
-                    "strength": "medium",
-                    "reason": "C1 and C2 worked together to develop a joint proposal for the gallery renovation",
-                    "confidence": 0.8
-                }}
-            ]
-            
-            If no alliances are detected, return an empty array: []
-            """
-            
-            # Apply rate limiting before API call
-            rate_limiter.wait_if_needed()
-            
-            # Use the shared LLM to analyze alliances
-            response = self.shared_llm.call(alliance_analysis_prompt)
-            # Handle different response formats from CrewAI LLM
-            if hasattr(response, 'content'):
-                response_text = str(response.content)
-            elif hasattr(response, 'text'):
-                response_text = str(response.text)
-            else:
-                response_text = str(response)
-            
-            # Parse the JSON response
-            import json
-            try:
-                # Extract JSON from response (handle cases where LLM adds extra text)
-                start_idx = response_text.find('[')
-                end_idx = response_text.rfind(']') + 1
-                if start_idx != -1 and end_idx != -1:
-                    json_str = response_text[start_idx:end_idx]
-                    alliance_analysis = json.loads(json_str)
-                    
-                    # Convert to our format
-                    for analysis in alliance_analysis:
-                        if analysis.get('confidence', 0) > 0.5:  # Only include high-confidence alliances
-                            alliances.append({
-                                "type": analysis.get("type", "collaboration"),
-                                "involved": analysis.get("involved", []),
-                                "context": f"LLM-analyzed alliance in {scenario_name}",
-                                "strength": analysis.get("strength", "medium"),
-                                "reason": analysis.get("reason", "No reason provided"),
-                                "confidence": analysis.get("confidence", 0.5),
-                                "month": month,
-                                "timestamp": datetime.now().isoformat()
-                            })
-                            
-            except json.JSONDecodeError as e:
-                logger.warning(f"Failed to parse LLM alliance analysis JSON: {e}")
-                logger.warning(f"LLM response: {response_text}")
-                
-        except Exception as e:
-            logger.error(f"Error in LLM alliance analysis: {e}")
-            # Fallback to simple keyword detection if LLM analysis fails
-            alliances = self._fallback_alliance_analysis(result_str, scenario_name, month)
-        
-        return alliances
-    
-    def _fallback_alliance_analysis(self, result_str: str, scenario_name: str, month: int) -> List[Dict]:
+    def _fallback_alliance_analysis(self, result_str: str, result_lower: str, lines: _TranscriptLines,
+                                    scenario_name: str, month: int) -> List[Dict]:
         """Fallback alliance analysis using simple keyword detection"""
         alliances = []
+        template = {
+            "type": "collaboration",
+            "involved": None,
+            "context": f"Fallback alliance detection in {scenario_name}",
+            "strength": "medium",
+            "reason": None,
+            "confidence": 0.3,  # Lower confidence for fallback
+            "month": month,
+            "timestamp": datetime.now().isoformat()
+        }
         
         # Look for alliance indicators
-        alliance_keywords = ["agree", "support", "collaborate", "unite", "together", "partnership", "alliance", "coalition"]
-        
-        for keyword in alliance_keywords:
-            if keyword.lower() in result_str.lower():
+        found = _ALLIANCE_KEYWORDS.find_offsets(result_lower)
+        for keyword in _ALLIANCE_KEYWORDS.keywords:
+            if keyword in found:
                 # Try to identify which cousins are involved
-                involved_cousins = self._identify_involved_cousins(result_str, keyword)
+                involved_cousins = self._identify_involved_cousins(lines, found[keyword])
                 if len(involved_cousins) >= 2:
-                    alliances.append({
-                        "type": "collaboration",
-                        "involved": involved_cousins,
-                        "context": f"Fallback alliance detection in {scenario_name}",
-                        "strength": "medium",
-                        "reason": f"Keyword '{keyword}' detected",
-                        "confidence": 0.3,  # Lower confidence for fallback
-                        "month": month,
-                        "timestamp": datetime.now().isoformat()
-                    })
+                    alliance = template.copy()
+                    alliance["involved"] = involved_cousins
+                    alliance["reason"] = f"Keyword '{keyword}' detected"
+                    alliances.append(alliance)
         
         return alliances
 
-    def _extract_trust_changes_from_result(self, result_str: str, scenario_name: str, month: int) -> List[Dict]:
-        """Extract trust level changes from CrewAI conversation result using LLM analysis"""
-        trust_changes = []
-        
-        try:
-            # Use LLM to analyze trust changes in the conversation
-            trust_analysis_prompt = f"""
-            Analyze the following family conversation for SPECIFIC trust level changes between INDIVIDUAL cousin pairs (C1, C2, C3, C4).
-            
-            Conversation from scenario: {scenario_name}
-            
-            {result_str}
-            
-            IMPORTANT: Look for SPECIFIC interactions between INDIVIDUAL cousin pairs, not general family dynamics.
-            
-            Look for:
-            - Direct expressions of trust, confidence, or reliability toward specific cousins
-            - Direct expressions of doubt, skepticism, or mistrust toward specific cousins
-            - Specific supportive or unsupportive behavior between individual cousins
-            - Specific agreement or disagreement between individual cousins
-            - Direct compliments or criticisms between specific cousins
-            - Specific collaborative or competitive behavior between individual cousins
-            
-            CRITICAL: Only identify trust changes between SPECIFIC cousin pairs (e.g., C1→C2, C2→C3, etc.).
-            Do NOT use "all" as a target_cousin. Be specific about which cousin's trust is changing toward which other cousin.
-            
-            Respond with a JSON array of trust changes, where each change has:
-            - "cousin": the cousin whose trust is being affected (C1, C2, C3, or C4)
-            - "target_cousin": the SPECIFIC cousin they're changing trust toward (C1, C2, C3, or C4) - NOT "all"
-            - "change": "positive" or "negative"
-            - "reason": brief explanation of the specific interaction that caused the trust change
-            - "confidence": confidence level from 0.0 to 1.0 (be conservative, only high confidence changes)
-            
-            Example format:
-            [
-                {{
-                    "cousin": "C1",
-                    "target_cousin": "C2", 
-                    "change": "positive",
-                    "reason": "C1 specifically praised C2's financial analysis and said 'I trust your judgment on this'",
-                    "confidence": 0.8
-                }},
-                {{
-                    "cousin": "C3",
-                    "target_cousin": "C1",
-                    "change": "negative", 
-                    "reason": "C3 disagreed with C1's proposal and said 'I'm not sure about this approach'",
-                    "confidence": 0.6
-                }}
-            ]
-            
-            If no specific trust changes between individual cousins are detected, return an empty array: []
-            """
-            
-            # Apply rate limiting before API call
-            rate_limiter.wait_if_needed()
-            
-            # Use the shared LLM to analyze trust changes
-            response = self.shared_llm.call(trust_analysis_prompt)
-            # Handle different response formats from CrewAI LLM
-            if hasattr(response, 'content'):
-                response_text = str(response.content)
-            elif hasattr(response, 'text'):
-                response_text = str(response.text)
-            else:
-                response_text = str(response)
-            
-            # Parse the JSON response
-            import json
-            try:
-                # Extract JSON from response (handle cases where LLM adds extra text)
-                start_idx = response_text.find('[')
-                end_idx = response_text.rfind(']') + 1
-                if start_idx != -1 and end_idx != -1:
-                    json_str = response_text[start_idx:end_idx]
-                    trust_analysis = json.loads(json_str)
-                    
-                    # Convert to our format
-                    for analysis in trust_analysis:
-                        if analysis.get('confidence', 0) > 0.5:  # Only include high-confidence changes
-                            trust_changes.append({
-                                "cousin": analysis.get("cousin"),
-                                "target_cousin": analysis.get("target_cousin"),
-                                "change": analysis.get("change"),
-                                "reason": analysis.get("reason"),
-                                "confidence": analysis.get("confidence"),
-                                "context": f"LLM-analyzed trust change in {scenario_name}",
-                                "month": month,
-                                "timestamp": datetime.now().isoformat()
-                            })
-                            
-            except json.JSONDecodeError as e:
-                logger.warning(f"Failed to parse LLM trust analysis JSON: {e}")
-                logger.warning(f"LLM response: {response_text}")
-                
-        except Exception as e:
-            logger.error(f"Error in LLM trust analysis: {e}")
-            # Fallback to simple keyword detection if LLM analysis fails
-            trust_changes = self._fallback_trust_analysis(result_str, scenario_name, month)
-        
-        return trust_changes
-    
-    def _fallback_trust_analysis(self, result_str: str, scenario_name: str, month: int) -> List[Dict]:
+    def _fallback_trust_analysis(self, result_str: str, result_lower: str, lines: _TranscriptLines,
+                                 scenario_name: str, month: int) -> List[Dict]:
         """Fallback trust analysis using simple keyword detection"""
         trust_changes = []
+        template = {
+            "cousin": None,
+            "target_cousin": "all",  # Fallback doesn't identify specific targets
+            "change": None,
+            "reason": None,
+            "confidence": 0.3,  # Lower confidence for fallback
+            "context": f"Fallback trust analysis in {scenario_name}",
+            "month": month,
+            "timestamp": datetime.now().isoformat()
+        }
         
         # Look for trust indicators
-        trust_keywords = ["trust", "reliable", "dependable", "skeptical", "doubt", "confidence", "faith"]
-        
-        for keyword in trust_keywords:
-            if keyword.lower() in result_str.lower():
+        found = _TRUST_KEYWORDS.find_offsets(result_lower)
+        for keyword in _TRUST_KEYWORDS.keywords:
+            if keyword in found:
                 # Try to identify which cousins are involved
-                involved_cousins = self._identify_involved_cousins(result_str, keyword)
+                involved_cousins = self._identify_involved_cousins(lines, found[keyword])
+                change = "positive" if keyword in _POSITIVE_TRUST_KEYWORDS else "negative"
+                reason = f"Keyword '{keyword}' detected"
                 for cousin in involved_cousins:
-                    trust_changes.append({
-                        "cousin": cousin,
-                        "target_cousin": "all",  # Fallback doesn't identify specific targets
-                        "change": "positive" if keyword in ["trust", "reliable", "dependable", "confidence", "faith"] else "negative",
-                        "reason": f"Keyword '{keyword}' detected",
-                        "confidence": 0.3,  # Lower confidence for fallback
-                        "context": f"Fallback trust analysis in {scenario_name}",
-                        "month": month,
-                        "timestamp": datetime.now().isoformat()
-                    })
+                    trust_change = template.copy()
+                    trust_change["cousin"] = cousin
+                    trust_change["change"] = change
+                    trust_change["reason"] = reason
+                    trust_changes.append(trust_change)
         
         return trust_changes
 
-    def _extract_behavioral_patterns_from_result(self, result_str: str, scenario_name: str, month: int) -> List[Dict]:
-        """Extract behavioral patterns from CrewAI conversation result using LLM analysis"""
-        patterns = []
-        
-        try:
-            # Use LLM to analyze behavioral patterns in the conversation
-            behavior_analysis_prompt = f"""
-            Analyze the following family conversation for behavioral patterns exhibited by the cousins (C1, C2, C3, C4).
-            
-            Conversation from scenario: {scenario_name}
-            
-            {result_str}
-            
-            Please identify specific behavioral patterns exhibited by individual cousins based on their actions, statements, and interactions.
-            Look for:
-            - Leadership behaviors (taking initiative, proposing solutions, directing others)
-            - Collaboration behaviors (working together, supporting others, coordinating efforts)
-            - Competitive behaviors (trying to outperform, asserting dominance, competing for influence)
-            - Compromise behaviors (finding middle ground, negotiating, balancing interests)
-            - Assertive behaviors (insisting on positions, demanding attention, pushing for decisions)
-            - Cooperative behaviors (agreeing with others, endorsing ideas, backing proposals)
-            - Passive behaviors (staying quiet, avoiding conflict, following others)
-            - Analytical behaviors (asking questions, seeking information, evaluating options)
-            
-            Respond with a JSON array of behavioral patterns, where each pattern has:
-            - "cousin": the cousin exhibiting the behavior (C1, C2, C3, or C4)
-            - "behavior_type": type of behavior (e.g., "leadership", "collaboration", "competition", "compromise", "assertiveness", "cooperation", "passive", "analytical")
-            - "description": brief description of the specific behavior observed
-            - "confidence": confidence level from 0.0 to 1.0
-            - "impact": "positive", "negative", or "neutral" based on the behavior's effect on the group
-            
-            Example format:
-            [
-                {{
-                    "cousin": "C1",
-                    "behavior_type": "leadership",
-                    "description": "C1 took initiative by proposing a structured approach to the decision-making process",
-                    "confidence": 0.8,
-                    "impact": "positive"
-                }},
-                {{
-                    "cousin": "C2",
-                    "behavior_type": "analytical",
-                    "description": "C2 asked detailed questions about the financial implications of each option",
-                    "confidence": 0.7,
-                    "impact": "positive"
-                }}
-            ]
-            
-            If no clear behavioral patterns are detected, return an empty array: []
-            """
-            
-            # Apply rate limiting before API call
-            rate_limiter.wait_if_needed()
-            
-            # Use the shared LLM to analyze behavioral patterns
-            response = self.shared_llm.call(behavior_analysis_prompt)
-            # Handle different response formats from CrewAI LLM
-            if hasattr(response, 'content'):
-                response_text = str(response.content)
-            elif hasattr(response, 'text'):
-                response_text = str(response.text)
-            else:
-                response_text = str(response)
-            
-            # Parse the JSON response
-            import json
-            try:
-                # Extract JSON from response (handle cases where LLM adds extra text)
-                start_idx = response_text.find('[')
-                end_idx = response_text.rfind(']') + 1
-                if start_idx != -1 and end_idx != -1:
-                    json_str = response_text[start_idx:end_idx]
-                    behavior_analysis = json.loads(json_str)
-                    
-                    # Convert to our format
-                    for analysis in behavior_analysis:
-                        if analysis.get('confidence', 0) > 0.5:  # Only include high-confidence patterns
-                            patterns.append({
-                                "cousin_id": analysis.get("cousin"),
-                                "behavior_type": analysis.get("behavior_type", "unknown"),
-                                "context": f"LLM-analyzed behavior in {scenario_name}",
-                                "description": analysis.get("description", "No description provided"),
-                                "outcome": analysis.get("impact", "neutral"),
-                                "confidence": analysis.get("confidence", 0.5),
-                                "month": month,
-                                "timestamp": datetime.now().isoformat()
-                            })
-                            
-            except json.JSONDecodeError as e:
-                logger.warning(f"Failed to parse LLM behavior analysis JSON: {e}")
-                logger.warning(f"LLM response: {response_text}")
-                
-        except Exception as e:
-            logger.error(f"Error in LLM behavior analysis: {e}")
-            # Fallback to simple keyword detection if LLM analysis fails
-            logger.info("🔄 Falling back to keyword-based behavioral pattern analysis...")
-            patterns = self._fallback_behavioral_patterns_analysis(result_str, scenario_name, month)
-            logger.info(f"📊 Fallback analysis found {len(patterns)} behavioral patterns")
-        
-        logger.info(f"📊 Total behavioral patterns extracted: {len(patterns)}")
-        return patterns
-    
-    def _fallback_behavioral_patterns_analysis(self, result_str: str, scenario_name: str, month: int) -> List[Dict]:
+    def _fallback_behavioral_patterns_analysis(self, result_str: str, result_lower: str, lines: _TranscriptLines,
+                                               scenario_name: str, month: int) -> List[Dict]:
         """Fallback behavioral patterns analysis using simple keyword detection"""
         patterns = []
-        
-        # Look for behavioral indicators
-        behavior_keywords = {
-            "leadership": ["lead", "initiate", "propose", "suggest", "direct", "take charge", "organize", "plan"],
-            "collaboration": ["work together", "collaborate", "coordinate", "unite", "team up", "join forces"],
-            "competition": ["compete", "outperform", "excel", "dominate", "beat", "win", "better than"],
-            "compromise": ["compromise", "negotiate", "balance", "middle ground", "meet halfway", "settle"],
-            "assertiveness": ["insist", "demand", "assert", "push for", "fight for", "stand firm", "refuse"],
-            "cooperation": ["agree", "support", "endorse", "back", "help", "assist", "contribute"],
-            "conflict_avoidance": ["avoid", "step back", "let it go", "not worth it", "ignore"],
-            "risk_taking": ["risk", "gamble", "chance", "opportunity", "bold", "aggressive"],
-            "conservative": ["careful", "safe", "cautious", "conservative", "slow", "gradual"]
+        template = {
+            "cousin_id": None,
+            "behavior_type": None,
+            "context": f"Fallback behavior detection in {scenario_name}",
+            "description": None,
+            "outcome": "positive",
+            "confidence": 0.3,  # Lower confidence for fallback
+            "month": month,
+            "timestamp": datetime.now().isoformat()
         }
         
         logger.info(f"🔍 Analyzing conversation for behavioral keywords in {scenario_name}...")
         keywords_found = 0
         
-        for behavior_type, keywords in behavior_keywords.items():
+        # Look for behavioral indicators, finding every keyword occurrence in one pass
+        found = _BEHAVIOR_SCANNER.find_offsets(result_lower)
+        for behavior_type, keywords in _BEHAVIOR_KEYWORDS.items():
             for keyword in keywords:
-                if keyword.lower() in result_str.lower():
+                if keyword in found:
                     keywords_found += 1
-                    logger.info(f"   Found keyword '{keyword}' for behavior type '{behavior_type}'")
+                    logger.debug("   Found keyword '%s' for behavior type '%s'", keyword, behavior_type)
                     # Use a different method for behavioral patterns that allows single cousins
-                    involved_cousins = self._identify_cousins_for_behavior(result_str, keyword)
-                    logger.info(f"   Cousins involved: {involved_cousins}")
+                    involved_cousins = self._identify_cousins_for_behavior(result_str, lines, found[keyword])
+                    logger.debug("   Cousins involved: %s", involved_cousins)
+                    description = f"Keyword '{keyword}' detected"
                     for cousin in involved_cousins:
-                        patterns.append({
-                            "cousin_id": cousin,
-                            "behavior_type": behavior_type,
-                            "context": f"Fallback behavior detection in {scenario_name}",
-                            "description": f"Keyword '{keyword}' detected",
-                            "outcome": "positive",
-                            "confidence": 0.3,  # Lower confidence for fallback
-                            "month": month,
-                            "timestamp": datetime.now().isoformat()
-                        })
+                        pattern = template.copy()
+                        pattern["cousin_id"] = cousin
+                        pattern["behavior_type"] = behavior_type
+                        pattern["description"] = description
+                        patterns.append(pattern)
         
         logger.info(f"🔍 Found {keywords_found} behavioral keywords, generated {len(patterns)} patterns")
         return patterns
 
-    def _identify_cousins_for_behavior(self, result_str: str, keyword: str) -> List[str]:
-        """Identify which cousins are mentioned in relation to a keyword for behavioral patterns"""
-        involved = []
-        cousin_names = ["C1", "C2", "C3", "C4"]
-        
-        # Simple approach: look for cousin names near the keyword
-        lines = result_str.split('\n')
-        for i, line in enumerate(lines):
-            if keyword.lower() in line.lower():
-                # Check current line and nearby lines for cousin names
-                for j in range(max(0, i-2), min(len(lines), i+3)):
-                    for cousin in cousin_names:
-                        if cousin in lines[j] and cousin not in involved:
-                            involved.append(cousin)
-        
-        # Remove duplicates - for behavioral patterns, we allow single cousins
-        involved = list(set(involved))
+    def _identify_cousins_for_behavior(self, result_str: str, lines: _TranscriptLines, offsets: List[int]) -> List[str]:
+        """Identify which cousins are mentioned near keyword occurrences (given by offset) for behavioral patterns"""
+        # Simple approach: look for cousin names near the keyword - for behavioral patterns, we allow single cousins
+        involved = _mask_cousins(lines.cousin_mask_near(offsets))
         
         # If no specific cousins found, try to find any cousin mentioned in the conversation
         if not involved:
-            for cousin in cousin_names:
-                if cousin in result_str:
-                    involved.append(cousin)
+            involved = _mask_cousins(_cousin_mask(result_str))
         
         return involved
 
-    def _identify_involved_cousins(self, result_str: str, keyword: str) -> List[str]:
-        """Identify which cousins are mentioned in relation to a keyword"""
-        involved = []
-        cousin_names = ["C1", "C2", "C3", "C4"]
-        
+    def _identify_involved_cousins(self, lines: _TranscriptLines, offsets: List[int]) -> List[str]:
+        """Identify which cousins are mentioned near keyword occurrences (given by offset)"""
         # Simple approach: look for cousin names near the keyword
-        lines = result_str.split('\n')
-        for i, line in enumerate(lines):
-            if keyword.lower() in line.lower():
-                # Check current line and nearby lines for cousin names
-                for j in range(max(0, i-2), min(len(lines), i+3)):
-                    for cousin in cousin_names:
-                        if cousin in lines[j] and cousin not in involved:
-                            involved.append(cousin)
-        
-        # Remove duplicates and ensure we have at least 2 different cousins for a conflict
-        involved = list(set(involved))
+        involved = _mask_cousins(lines.cousin_mask_near(offsets))
+        
+        # Ensure we have at least 2 different cousins for a conflict
         if len(involved) < 2:
             # If we can't identify specific cousins, return empty list (no conflict)
             return []
@@ -1906,6 +2154,9 @@ class FamilyInheritanceExperiment:
     def _apply_relationship_updates(self, conflicts: List[Dict], alliances: List[Dict], 
                                   trust_changes: List[Dict], behavioral_patterns: List[Dict]):
         """Apply relationship updates to the relationship dynamics"""
+        relationship_dynamics = self.relationship_dynamics
+        relationship_keys = self._relationship_keys
+        cousin_index = self._cousin_index
         
         # Update conflicts
         for conflict in conflicts:
@@ -1916,7 +2167,7 @@ class FamilyInheritanceExperiment:
             
             # Check for duplicate conflicts before adding
             for cousin in involved_cousins:
-                if cousin in self.relationship_dynamics:
+                if cousin in relationship_dynamics:
                     # Create a filtered conflict record that excludes self-references
                     filtered_involved = [c for c in involved_cousins if c != cousin]
                     
@@ -1926,17 +2177,11 @@ class FamilyInheritanceExperiment:
                         filtered_conflict["involved"] = filtered_involved
                         
                         # Check if this conflict already exists (same type, same involved cousins)
-                        existing_conflicts = self.relationship_dynamics[cousin]["conflicts"]
-                        is_duplicate = False
-                        
-                        for existing in existing_conflicts:
-                            if (existing.get("type") == filtered_conflict.get("type") and 
-                                set(existing.get("involved", [])) == set(filtered_involved)):
-                                is_duplicate = True
-                                break
-                        
-                        if not is_duplicate:
-                            self.relationship_dynamics[cousin]["conflicts"].append(filtered_conflict)
+                        key = _relationship_key(filtered_conflict)
+                        existing_keys = relationship_keys[cousin]["conflicts"]
+                        if key not in existing_keys:
+                            existing_keys.add(key)
+                            relationship_dynamics[cousin]["conflicts"].append(filtered_conflict)
             
             # Log conflict details
             if len(involved_cousins) >= 2:
@@ -1953,7 +2198,7 @@ class FamilyInheritanceExperiment:
             
             # Check for duplicate alliances before adding
             for cousin in involved_cousins:
-                if cousin in self.relationship_dynamics:
+                if cousin in relationship_dynamics:
                     # Create a filtered alliance record that excludes self-references
                     filtered_involved = [c for c in involved_cousins if c != cousin]
                     
@@ -1963,17 +2208,11 @@ class FamilyInheritanceExperiment:
                         filtered_alliance["involved"] = filtered_involved
                         
                         # Check if this alliance already exists (same type, same involved cousins)
-                        existing_alliances = self.relationship_dynamics[cousin]["alliances"]
-                        is_duplicate = False
-                        
-                        for existing in existing_alliances:
-                            if (existing.get("type") == filtered_alliance.get("type") and 
-                                set(existing.get("involved", [])) == set(filtered_involved)):
-                                is_duplicate = True
-                                break
-                        
-                        if not is_duplicate:
-                            self.relationship_dynamics[cousin]["alliances"].append(filtered_alliance)
+                        key = _relationship_key(filtered_alliance)
+                        existing_keys = relationship_keys[cousin]["alliances"]
+                        if key not in existing_keys:
+                            existing_keys.add(key)
+                            relationship_dynamics[cousin]["alliances"].append(filtered_alliance)
             
             # Log alliance details
             if len(involved_cousins) >= 2:
@@ -1982,52 +2221,51 @@ class FamilyInheritanceExperiment:
                 logger.info(f"   Reason: {reason}")
         
         # Initialize trust levels for all cousins if not already done
-        for cousin_id in self.cousins.keys():
-            if not self.relationship_dynamics[cousin_id]["trust_levels"]:
-                self.relationship_dynamics[cousin_id]["trust_levels"] = {}
-                # Initialize with varied trust levels based on personality and relationships
-                for other_cousin in self.cousins.keys():
-                    if other_cousin != cousin_id:
-                        # Add personality-based variation to initial trust levels
-                        import hashlib
-                        trust_hash = hashlib.md5(f"{cousin_id}_{other_cousin}".encode()).hexdigest()
-                        personality_factor = (int(trust_hash[:2], 16) / 255.0 - 0.5) * 0.2  # ±0.1 variation
-                        base_trust = 0.5 + personality_factor
-                        self.relationship_dynamics[cousin_id]["trust_levels"][other_cousin] = max(0.3, min(0.7, base_trust))
+        pending = ~self._trust_established
+        if pending.any():
+            rows = pending[:, None] & self._off_diagonal
+            self._trust[rows] = self._initial_trust[rows]
+            self._trust_established[:] = True
         
         # Update trust levels
         for trust_change in trust_changes:
             cousin = trust_change.get("cousin")
             target_cousin = trust_change.get("target_cousin")
             confidence = trust_change.get("confidence", 0.5)
+            change = trust_change.get("change")
             
-            if cousin in self.relationship_dynamics:
+            i = cousin_index.get(cousin)
+            if i is not None:
                 # Calculate trust change amount based on confidence
                 base_change = 0.15  # Increased base change for more meaningful differences
                 confidence_multiplier = confidence  # Higher confidence = larger change
                 trust_change_amount = base_change * confidence_multiplier
                 
                 if target_cousin == "all":
-                    # Update trust levels with all other cousins (fallback behavior)
-                    for other_cousin in self.cousins.keys():
-                        if other_cousin != cousin:
-                            current_trust = self.relationship_dynamics[cousin]["trust_levels"].get(other_cousin, 0.5)
-                            if trust_change.get("change") == "positive":
-                                new_trust = min(1.0, current_trust + trust_change_amount)
-                            else:
-                                new_trust = max(0.0, current_trust - trust_change_amount)
-                            self.relationship_dynamics[cousin]["trust_levels"][other_cousin] = new_trust
-                            logger.info(f"🛡️ Trust update: {cousin} → {other_cousin}: {current_trust:.2f} → {new_trust:.2f} ({trust_change.get('change')}, confidence: {confidence:.2f})")
-                elif target_cousin in self.cousins.keys() and target_cousin != cousin:
+                    # Update trust levels with all other cousins (fallback behavior) in one row operation
+                    row = self._trust[i]
+                    previous_row = row.copy()
+                    if change == "positive":
+                        np.minimum(row + trust_change_amount, 1.0, out=row, where=self._off_diagonal[i])
+                    else:
+                        np.maximum(row - trust_change_amount, 0.0, out=row, where=self._off_diagonal[i])
+                    if logger.isEnabledFor(logging.INFO):
+                        for other_cousin, j in cousin_index.items():
+                            if other_cousin != cousin:
+                                logger.info("🛡️ Trust update: %s → %s: %.2f → %.2f (%s, confidence: %.2f)",
+                                            cousin, other_cousin, previous_row[j], row[j], change, confidence)
+                elif target_cousin in cousin_index and target_cousin != cousin:
                     # Update trust level with specific target cousin
-                    current_trust = self.relationship_dynamics[cousin]["trust_levels"].get(target_cousin, 0.5)
-                    if trust_change.get("change") == "positive":
+                    j = cousin_index[target_cousin]
+                    current_trust = float(self._trust[i, j])
+                    if change == "positive":
                         new_trust = min(1.0, current_trust + trust_change_amount)
                     else:
                         new_trust = max(0.0, current_trust - trust_change_amount)
-                    self.relationship_dynamics[cousin]["trust_levels"][target_cousin] = new_trust
-                    logger.info(f"🛡️ Trust update: {cousin} → {target_cousin}: {current_trust:.2f} → {new_trust:.2f} ({trust_change.get('change')}, confidence: {confidence:.2f})")
-                    logger.info(f"   Reason: {trust_change.get('reason', 'No reason provided')}")
+                    self._trust[i, j] = new_trust
+                    logger.info("🛡️ Trust update: %s → %s: %.2f → %.2f (%s, confidence: %.2f)",
+                                cousin, target_cousin, current_trust, new_trust, change, confidence)
+                    logger.info("   Reason: %s", trust_change.get('reason', 'No reason provided'))
 
     def _display_monthly_summary(self, month: int):
         """Display detailed monthly summary with all decisions and conversations"""
@@ -2036,7 +2274,7 @@ class FamilyInheritanceExperiment:
         logger.info("="*80)
         
         # Get all scenarios from this month
-        month_scenarios = [s for s in self.scenario_history if s['month'] == month]
+        month_scenarios = self._scenarios_by_month.get(month, ())
         
         logger.info(f"📋 Scenarios Completed: {len(month_scenarios)}")
         logger.info("-"*80)
@@ -2059,7 +2297,7 @@ class FamilyInheritanceExperiment:
         # Show resource status for each cousin
         logger.info("💰 RESOURCE STATUS:")
         logger.info("-"*80)
-        for cousin_id in self.cousins.keys():
+        for cousin_id in self._cousin_ids:
             status = self.resource_manager.get_resource_status(cousin_id)
             logger.info(f"👤 {cousin_id}:")
             logger.info(f"   ⏰ Time: {status['time_hours']:.1f} hours")
@@ -2073,9 +2311,10 @@ class FamilyInheritanceExperiment:
             logger.info(f"👤 {cousin_id}:")
             
             # Trust levels
-            if dynamics.get("trust_levels"):
+            trust_levels = self._trust_levels(cousin_id)
+            if trust_levels:
                 logger.info("   🛡️ Trust Levels:")
-                for other_cousin, trust_level in dynamics["trust_levels"].items():
+                for other_cousin, trust_level in trust_levels.items():
                     logger.info(f"      → {other_cousin}: {trust_level:.2f}")
             else:
                 logger.info("   🛡️ Trust Levels: None established")
@@ -2098,8 +2337,7 @@ class FamilyInheritanceExperiment:
         # Show behavioral patterns
         logger.info("\n📊 BEHAVIORAL PATTERNS:")
         logger.info("-"*80)
-        month_behaviors = [b for b in self.metrics_tracker.behavioral_patterns 
-                          if b.month == month]
+        month_behaviors = self.metrics_tracker.get_behavioral_patterns(month)
         logger.info(f"🔍 Total behavioral patterns in tracker: {len(self.metrics_tracker.behavioral_patterns)}")
         logger.info(f"🔍 Patterns for month {month}: {len(month_behaviors)}")
         if month_behaviors:
@@ -2116,10 +2354,11 @@ class FamilyInheritanceExperiment:
         if target_month is None:
             # If no target month specified, load from the most recent state file
             state_files = []
-            for month in range(1, 7):  # Check months 1-6
-                month_state_file = f"{self.state_file_base}_month_{month}.json"
-                if os.path.exists(month_state_file):
-                    state_files.append((month, month_state_file))
+            with os.scandir(self.state_dir) as entries:  # One directory read instead of a stat per month
+                for entry in entries:
+                    match = self._state_file_re.match(entry.name)
+                    if match and 1 <= int(match.group(1)) <= 6:  # Check months 1-6
+                        state_files.append((int(match.group(1)), entry.path))
             
             if not state_files:
                 logger.info("📁 No previous state found, starting fresh")
@@ -2151,8 +2390,7 @@ class FamilyInheritanceExperiment:
         self.state_file = state_file_to_load
         
         try:
-            with open(self.state_file, 'r') as f:
-                state = json.load(f)
+            state = _read_json(self.state_file)
             
             # Restore timeline
             self.timeline.current_month = state["timeline"]["current_month"]
@@ -2173,22 +2411,27 @@ class FamilyInheritanceExperiment:
             self.resource_manager.shared_resources.legal_fund = shared_data["legal_fund"]
             
             # Restore relationship dynamics
-            self.relationship_dynamics = state["relationship_dynamics"]
+            self._restore_relationship_dynamics(state["relationship_dynamics"])
             
             # Restore scenario history
             self.scenario_history = state["scenario_history"]
+            self._index_scenario_history()
             
             # Restore experiment data
             self.experiment_data = state["experiment_data"]
+            self._month_end_status = {
+                summary["month"]: summary["resource_status"]
+                for key, summary in self.experiment_data.items()
+                if key.endswith("_decisions") and isinstance(summary, dict) and "resource_status" in summary
+            }
             
             # Restore metrics tracker
             self.metrics_tracker.current_month = state["metrics_tracker"]["current_month"]
             
             # Restore quantitative metrics
             from analytics.metrics import QuantitativeMetrics
-            self.metrics_tracker.quantitative_metrics = []
-            for m_data in state["metrics_tracker"]["quantitative_metrics"]:
-                metric = QuantitativeMetrics(
+            self.metrics_tracker.quantitative_metrics = [
+                QuantitativeMetrics(
                     cousin_id=m_data["cousin_id"],
                     month=m_data["month"],
                     financial_returns=m_data.get("financial_returns", 0.0),
@@ -2197,14 +2440,15 @@ class FamilyInheritanceExperiment:
                     influence_index=m_data.get("influence_index", 0.0),
                     future_opportunities=m_data.get("future_opportunities", 0)
                 )
-                self.metrics_tracker.quantitative_metrics.append(metric)
+                for m_data in state["metrics_tracker"]["quantitative_metrics"]
+            ]
             
             # Restore conversation logs
             from analytics.metrics import ConversationLog
-            self.metrics_tracker.conversation_logs = []
-            for log_data in state["metrics_tracker"]["conversation_logs"]:
-                log = ConversationLog(
-                    timestamp=datetime.fromisoformat(log_data["timestamp"]),
+            fromisoformat = datetime.fromisoformat
+            self.metrics_tracker.conversation_logs = [
+                ConversationLog(
+                    timestamp=fromisoformat(log_data["timestamp"]),
                     participants=log_data["participants"],
                     conversation_type=log_data["conversation_type"],
                     topic=log_data["topic"],
@@ -2212,7 +2456,8 @@ class FamilyInheritanceExperiment:
                     decisions_made=log_data["decisions_made"],
                     influence_tactics=log_data["influence_tactics"]
                 )
-                self.metrics_tracker.conversation_logs.append(log)
+                for log_data in state["metrics_tracker"]["conversation_logs"]
+            ]
             
             logger.info(f"📁 Experiment state loaded from {self.state_file}")
             logger.info(f"📅 Resuming from Month {self.timeline.current_month}, Week {self.timeline.current_week}")
@@ -2236,8 +2481,7 @@ class FamilyInheritanceExperiment:
             return 0
         
         try:
-            with open(self.state_file, 'r') as f:
-                state = json.load(f)
+            state = _read_json(self.state_file)
             return state["timeline"]["current_month"]
         except:
             return 0
@@ -2265,11 +2509,7 @@ class FamilyInheritanceExperiment:
         logger.info("=" * 60)
         
         # Force CrewAI to use GPT-2 on Hugging Face by setting environment variable
-        huggingface_key = os.getenv('HF_TOKEN')
-        if huggingface_key:
-            os.environ['OPENAI_API_KEY'] = huggingface_key
-            logger.info("🔧 Configured CrewAI to use GPT-2 on Hugging Face")
-            logger.info("🔑 Set Hugging Face API key for CrewAI compatibility")
+        _configure_llm_env()
         
         # Set current month
         self.timeline.current_month = month
@@ -2283,8 +2523,7 @@ class FamilyInheritanceExperiment:
             self._load_all_previous_months_context(month - 1)
         
         # Get events for this month
-        month_events = [event for event in self.timeline.events 
-                      if event.month == month]
+        month_events = self.timeline.get_events_for_month(month)
         
         if not month_events:
             logger.warning(f"⚠️  No events found for Month {month}")
@@ -2297,9 +2536,7 @@ class FamilyInheritanceExperiment:
             outcome = self.run_scenario(event)
             logger.info(f"✅ Scenario completed: {event.title}")
             
-            # Add delay between scenarios to prevent API overload
-            logger.info("⏳ Waiting between scenarios to respect API limits...")
-            time.sleep(10)  # 10 second delay between scenarios
+            # API pacing is handled per request by the rate limiter, so no fixed delay here
             
             # Advance week
             self.timeline.advance_week()
@@ -2330,8 +2567,10 @@ class FamilyInheritanceExperiment:
         # Export results for this month
         logger.info("💾 Exporting results...")
         self.metrics_tracker.export_to_json(self.results_file)
-        with open(self.data_file, "w") as f:
-            json.dump(self.experiment_data, f, indent=2)
+        _write_json(self.data_file, self.experiment_data)
+        
+        # The state save overlapped the exports above; make sure it is on disk before finishing
+        self.close()
         
         logger.info(f"🎉 Month {month} completed successfully!")
         logger.info(f"📊 Results saved to:")
@@ -2360,11 +2599,7 @@ class FamilyInheritanceExperiment:
         logger.info("=" * 60)
         
         # Force CrewAI to use GPT-2 on Hugging Face by setting environment variable
-        huggingface_key = os.getenv('HF_TOKEN')
-        if huggingface_key:
-            os.environ['OPENAI_API_KEY'] = huggingface_key
-            logger.info("🔧 Configured CrewAI to use GPT-2 on Hugging Face")
-            logger.info("🔑 Set Hugging Face API key for CrewAI compatibility")
+        _configure_llm_env()
         
         # Continue from the next month
         start_month = self.timeline.current_month + 1
@@ -2391,17 +2626,14 @@ class FamilyInheritanceExperiment:
                 self._load_all_previous_months_context(month - 1)
             
             # Get events for this month
-            month_events = [event for event in self.timeline.events 
-                          if event.month == month]
+            month_events = self.timeline.get_events_for_month(month)
             
             for event in month_events:
                 logger.info(f"🔄 Running scenario: {event.title}")
                 outcome = self.run_scenario(event)
                 logger.info(f"✅ Scenario completed: {event.title}")
                 
-                # Add delay between scenarios to prevent API overload
-                logger.info("⏳ Waiting between scenarios to respect API limits...")
-                time.sleep(30)  # 30 second delay between scenarios (increased from 10)
+                # API pacing is handled per request by the rate limiter, so no fixed delay here
                 
                 # Advance week
                 self.timeline.advance_week()
@@ -2420,11 +2652,9 @@ class FamilyInheritanceExperiment:
             
             # Save complete experiment state after each month
             self.save_experiment_state()
-            
-            # Add delay between months to prevent API overload
-            if month < 6:  # Don't wait after the last month
-                logger.info("⏳ Waiting between months to respect API limits...")
-                time.sleep(60)  # 60 second delay between months (increased from 30)
+        
+        # Make sure the last month's state is on disk and stop the state writer before reporting
+        self.close()
         
         # Final analysis
         logger.info("📊 Generating final report...")
@@ -2440,10 +2670,14 @@ def main():
         logger.error("Error: HF_TOKEN environment variable not set")
         logger.error("Please set your Hugging Face API key before running the experiment")
         return
+    _configure_llm_env()
     
     # Run the experiment
     experiment = FamilyInheritanceExperiment()
-    experiment.run_full_experiment()
+    try:
+        experiment.run_full_experiment()
+    finally:
+        experiment.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -7,43 +7,55 @@ Manages finite resources: Time, Money, Social Connections, Reputation Points
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, field
 from enum import Enum
+from collections import Counter
 import json
+import re
+
+# Speaker tags like "C1:" in a conversation, counted in one pass for all cousins
+_COUSIN_MENTION_RE = re.compile(r'(C[1-4]):')
+
+# Weekly hours per cousin; different cousins have different time management styles
+_WEEKLY_TIME_BUDGET = {
+    "C1": 42.0,  # Creative works longer hours
+    "C2": 38.0,  # Social spends time networking
+    "C3": 40.0,  # Analytical is consistent
+    "C4": 45.0   # Execution works extra hours
+}
 
 class ResourceType(Enum):
     TIME = "time"
     MONEY = "money"
     REPUTATION = "reputation"
 
-@dataclass
+@dataclass(slots=True)
 class ResourcePool:
     """Individual resource pool for a cousin"""
     time_hours: float = 40.0  # 40 hours per week
     money: float = 0.0
     reputation_points: float = 0.0
     
+    # Pool attribute holding each resource type
+    _ATTR_MAP = {
+        ResourceType.TIME: "time_hours",
+        ResourceType.MONEY: "money",
+        ResourceType.REPUTATION: "reputation_points",
+    }
+    
     def can_allocate(self, resource_type: ResourceType, amount: float) -> bool:
         """Check if resource can be allocated"""
-        if resource_type == ResourceType.TIME:
-            return self.time_hours >= amount
-        elif resource_type == ResourceType.MONEY:
-            return self.money >= amount
-        elif resource_type == ResourceType.REPUTATION:
-            return self.reputation_points >= amount
-        return True
+        attr = self._ATTR_MAP.get(resource_type)
+        return attr is None or getattr(self, attr) >= amount
     
     def allocate(self, resource_type: ResourceType, amount: float, description: str = ""):
         """Allocate resources and track the allocation"""
         if not self.can_allocate(resource_type, amount):
             raise ValueError(f"Insufficient {resource_type.value}")
         
-        if resource_type == ResourceType.TIME:
-            self.time_hours -= amount
-        elif resource_type == ResourceType.MONEY:
-            self.money -= amount
-        elif resource_type == ResourceType.REPUTATION:
-            self.reputation_points -= amount
+        attr = self._ATTR_MAP.get(resource_type)
+        if attr is not None:
+            setattr(self, attr, getattr(self, attr) - amount)
 
-@dataclass
+@dataclass(slots=True)
 class SharedResourcePool:
     """Shared resources that all cousins can access"""
     shared_budget: float = 100000.0  # Initial inheritance
@@ -78,18 +90,26 @@ class ResourceManager:
         if cousin_id not in self.cousin_resources:
             return False
         
+        entry = self._allocate(cousin_id, resource_type, amount, description)
+        if entry is None:
+            return False
+        self.allocation_history.append(entry)
+        return True
+    
+    def _allocate(self, cousin_id: str, resource_type: ResourceType,
+                  amount: float, description: str) -> Optional[Dict[str, Any]]:
+        """Allocate from a cousin's pool and return its history entry, or None if the pool is short"""
         try:
             self.cousin_resources[cousin_id].allocate(resource_type, amount, description)
-            self.allocation_history.append({
-                "cousin": cousin_id,
-                "resource": resource_type.value,
-                "amount": amount,
-                "description": description,
-                "type": "individual"
-            })
-            return True
         except ValueError:
-            return False
+            return None
+        return {
+            "cousin": cousin_id,
+            "resource": resource_type.value,
+            "amount": amount,
+            "description": description,
+            "type": "individual"
+        }
     
     def allocate_shared_resource(self, amount: float, purpose: str) -> bool:
         """Allocate from shared resources"""
@@ -108,21 +128,23 @@ class ResourceManager:
         if cousin_id not in self.cousin_resources:
             return
         
-        if resource_type == ResourceType.TIME:
-            self.cousin_resources[cousin_id].time_hours += amount
-        elif resource_type == ResourceType.MONEY:
-            self.cousin_resources[cousin_id].money += amount
-        elif resource_type == ResourceType.REPUTATION:
-            self.cousin_resources[cousin_id].reputation_points += amount
-        
         # Track the resource addition in history
-        self.allocation_history.append({
+        self.allocation_history.append(self._add(cousin_id, resource_type, amount, description))
+    
+    def _add(self, cousin_id: str, resource_type: ResourceType, amount: float, description: str) -> Dict[str, Any]:
+        """Add to a cousin's pool and return its history entry"""
+        attr = ResourcePool._ATTR_MAP.get(resource_type)
+        if attr is not None:
+            pool = self.cousin_resources[cousin_id]
+            setattr(pool, attr, getattr(pool, attr) + amount)
+        
+        return {
             "cousin": cousin_id,
             "resource": resource_type.value,
             "amount": amount,
             "description": description,
             "type": "addition"
-        })
+        }
     
     def get_resource_status(self, cousin_id: str) -> Dict[str, Any]:
         """Get current resource status for a cousin"""
@@ -148,16 +170,8 @@ class ResourceManager:
     
     def reset_weekly_time(self):
         """Reset time allocation for new week with personality-based variations"""
-        # Different cousins have different time management styles
-        time_allocations = {
-            "C1": 42.0,  # Creative works longer hours
-            "C2": 38.0,  # Social spends time networking
-            "C3": 40.0,  # Analytical is consistent
-            "C4": 45.0   # Execution works extra hours
-        }
-        
-        for cousin_id in self.cousin_resources:
-            self.cousin_resources[cousin_id].time_hours = time_allocations.get(cousin_id, 40.0)
+        for cousin_id, resources in self.cousin_resources.items():
+            resources.time_hours = _WEEKLY_TIME_BUDGET.get(cousin_id, 40.0)
     
     def calculate_resource_efficiency(self, cousin_id: str) -> float:
         """Calculate how efficiently a cousin uses their resources"""
@@ -172,6 +186,8 @@ class ResourceManager:
     
     def update_resources_from_scenario(self, scenario_name: str, cousin_contributions: Dict[str, Dict[str, float]]):
         """Update resources based on individual cousin contributions to a scenario"""
+        # Collect the scenario's history entries and record them together
+        entries = []
         for cousin_id, contributions in cousin_contributions.items():
             if cousin_id not in self.cousin_resources:
                 continue
@@ -179,33 +195,36 @@ class ResourceManager:
             # Time spent on scenario (varies by personality and involvement)
             time_spent = contributions.get("time_spent", 0.0)
             if time_spent > 0:
-                self.allocate_individual_resource(
+                entries.append(self._allocate(
                     cousin_id, ResourceType.TIME, time_spent, f"Time spent on {scenario_name}"
-                )
+                ))
             
             # Money earned or spent
             money_change = contributions.get("money_change", 0.0)
             if money_change != 0:
                 if money_change > 0:
-                    self.add_resource(
+                    entries.append(self._add(
                         cousin_id, ResourceType.MONEY, money_change, f"Earned from {scenario_name}"
-                    )
+                    ))
                 else:
-                    self.allocate_individual_resource(
+                    entries.append(self._allocate(
                         cousin_id, ResourceType.MONEY, abs(money_change), f"Spent on {scenario_name}"
-                    )
+                    ))
             
             # Reputation change based on performance
             reputation_change = contributions.get("reputation_change", 0.0)
             if reputation_change != 0:
                 if reputation_change > 0:
-                    self.add_resource(
+                    entries.append(self._add(
                         cousin_id, ResourceType.REPUTATION, reputation_change, f"Reputation gain from {scenario_name}"
-                    )
+                    ))
                 else:
-                    self.allocate_individual_resource(
+                    entries.append(self._allocate(
                         cousin_id, ResourceType.REPUTATION, abs(reputation_change), f"Reputation loss from {scenario_name}"
-                    )
+                    ))
+        
+        # Allocations the pool could not cover leave no entry
+        self.allocation_history.extend(entry for entry in entries if entry is not None)
     
     def calculate_individual_contributions(self, scenario_name: str, conversation_result: str) -> Dict[str, Dict[str, float]]:
         """Calculate individual cousin contributions based on conversation analysis"""
@@ -219,12 +238,14 @@ class ResourceManager:
             "C4": {"time_spent": 12.0, "money_change": 400.0, "reputation_change": 1.5}  # Execution, hard work
         }
         
+        # Count mentions of each cousin in conversation (proxy for involvement)
+        mention_counts = Counter(_COUSIN_MENTION_RE.findall(conversation_result))
+        
         # Add variation based on conversation content
         for cousin_id in ["C1", "C2", "C3", "C4"]:
             base = base_patterns[cousin_id].copy()
             
-            # Count mentions of cousin in conversation (proxy for involvement)
-            mentions = conversation_result.count(f"{cousin_id}:")
+            mentions = mention_counts[cousin_id]
             involvement_multiplier = min(1.0 + (mentions - 3) * 0.1, 1.5)  # 0.7 to 1.5 multiplier
             
             # Apply involvement multiplier
@@ -238,45 +259,20 @@ class ResourceManager:
 
     def export_resource_data(self) -> Dict[str, Any]:
         """Export all resource data for analysis"""
-        try:
-            return {
-                "cousin_resources": {
-                    cousin_id: {
-                        "time_hours": resources.time_hours,
-                        "money": resources.money,
-                        "reputation_points": resources.reputation_points
-                    }
-                    for cousin_id, resources in self.cousin_resources.items()
-                },
-                "shared_resources": {
-                    "shared_budget": self.shared_resources.shared_budget,
-                    "gallery_reputation": self.shared_resources.gallery_reputation,
-                    "family_reputation": self.shared_resources.family_reputation,
-                    "legal_fund": self.shared_resources.legal_fund
-                },
-                "allocation_history": self.allocation_history
-            }
-        except AttributeError as e:
-            if "social_connections" in str(e):
-                # This error suggests there's a mismatch between ResourcePool and CousinAgent objects
-                # Return a safe version without the problematic attribute
-                return {
-                    "cousin_resources": {
-                        cousin_id: {
-                            "time_hours": getattr(resources, 'time_hours', 0.0),
-                            "money": getattr(resources, 'money', 0.0),
-                            "reputation_points": getattr(resources, 'reputation_points', 0.0)
-                        }
-                        for cousin_id, resources in self.cousin_resources.items()
-                    },
-                    "shared_resources": {
-                        "shared_budget": self.shared_resources.shared_budget,
-                        "gallery_reputation": self.shared_resources.gallery_reputation,
-                        "family_reputation": self.shared_resources.family_reputation,
-                        "legal_fund": self.shared_resources.legal_fund
-                    },
-                    "allocation_history": self.allocation_history,
-                    "error": f"Resource export had attribute error: {e}"
+        return {
+            "cousin_resources": {
+                cousin_id: {
+                    "time_hours": resources.time_hours,
+                    "money": resources.money,
+                    "reputation_points": resources.reputation_points
                 }
-            else:
-                raise
+                for cousin_id, resources in self.cousin_resources.items()
+            },
+            "shared_resources": {
+                "shared_budget": self.shared_resources.shared_budget,
+                "gallery_reputation": self.shared_resources.gallery_reputation,
+                "family_reputation": self.shared_resources.family_reputation,
+                "legal_fund": self.shared_resources.legal_fund
+            },
+            "allocation_history": self.allocation_history
+        }